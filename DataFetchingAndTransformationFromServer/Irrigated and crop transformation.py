@@ -1,5 +1,6 @@
 import sqlite3
 import pandas as pd
+import numpy as np
 import os
 import sys
 from datetime import datetime, timedelta
@@ -50,7 +51,19 @@ def create_transformed_databases():
     # Create separate connections
     crop_conn = sqlite3.connect(f'{transform_dir}/crop_prices_transformed.db')
     irr_conn = sqlite3.connect(f'{transform_dir}/irrigation_transformed.db')
-    
+
+    # Tune both databases for the bulk writeback: WAL drops the fsync
+    # per commit and the cache/mmap settings keep the load in memory
+    for conn in (crop_conn, irr_conn):
+        conn.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-131072;
+        PRAGMA mmap_size=268435456;
+        ''')
+
+
     # Create transformed crop prices table
     crop_cursor = crop_conn.cursor()
     crop_cursor.execute('''
@@ -92,75 +105,113 @@ def create_transformed_databases():
     irr_conn.commit()
     return crop_conn, irr_conn
 
+CROP_GROUP_KEYS = ['State', 'District', 'Market', 'Commodity']
+
+# Rows fetched per federator round trip; peak memory is one page plus
+# the tail of the group that continues into the next page
+CROP_PAGE_SIZE = 250_000
+
+def compute_price_analytics(df):
+    """Compute the per-group price analytics for a block of whole groups"""
+    # Parse dates once and sort so every group is contiguous and
+    # ordered by date
+    df = df.copy()
+    df['Arrival_Date'] = pd.to_datetime(df['Arrival_Date'])
+
+    # Integer-code the key columns so the groupbys hash category codes
+    # instead of tuples of Python strings
+    for col in CROP_GROUP_KEYS:
+        df[col] = df[col].astype('category')
+
+    df = df.sort_values(CROP_GROUP_KEYS + ['Arrival_Date']).reset_index(drop=True)
+
+    # Monthly and yearly averages per group via groupby-transform; each
+    # is a single C-level pass instead of a rescan per row
+    month = df['Arrival_Date'].dt.to_period('M')
+    year = df['Arrival_Date'].dt.year
+    monthly_avg = df.groupby(CROP_GROUP_KEYS + [month], sort=False,
+                             observed=True)['Modal_Price'].transform('mean')
+    yearly_avg = df.groupby(CROP_GROUP_KEYS + [year], sort=False,
+                            observed=True)['Modal_Price'].transform('mean')
+    seasonal_index = (df['Modal_Price'] / yearly_avg).where(yearly_avg != 0, 1)
+
+    # Trend and volatility over a trailing 30-day window per group; the
+    # default closed='right' window matches the old (date-30d, date] mask
+    rolled = (df.groupby(CROP_GROUP_KEYS, sort=False, observed=True)
+                .rolling('30D', on='Arrival_Date')['Modal_Price']
+                .agg(['first', 'count', 'std']))
+    window_first = rolled['first'].to_numpy()
+    window_count = rolled['count'].to_numpy()
+    has_window = window_count > 1
+    trend = np.where(has_window, (df['Modal_Price'].to_numpy() - window_first) / window_first, 0)
+    volatility = np.where(has_window, rolled['std'].to_numpy(), 0)
+
+    # Assemble the output column-wise with no Python loop
+    return pd.DataFrame({
+        'state': df['State'],
+        'district': df['District'],
+        'market': df['Market'],
+        'commodity': df['Commodity'],
+        'variety': df['Variety'],
+        'arrival_date': df['Arrival_Date'],
+        'price_per_quintal': df['Modal_Price'],
+        'monthly_avg_price': monthly_avg,
+        'price_trend_indicator': trend,
+        'seasonal_index': seasonal_index,
+        'price_volatility': volatility
+    })
+
 def transform_crop_prices(federator, crop_server, target_conn):
     """Transform crop prices data with additional analytics"""
-    
-    # Fetch data using federator
-    query = "SELECT * FROM crop_prices ORDER BY Arrival_Date"
-    data = federator.query_server(crop_server, query)
-    
-    if data is None:
-        console.print("[bold red]Failed to fetch crop prices data from the server[/bold red]")
-        return
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    
-    transformed_data = []
-    
-    # Group by state, district, market, commodity
-    for name, group in df.groupby(['State', 'District', 'Market', 'Commodity']):
-        state, district, market, commodity = name
-        
-        # Rest of the transformation logic remains the same
-        group = group.sort_values('Arrival_Date')
-        
-        for _, row in group.iterrows():
-            # Calculate monthly average
-            month_start = pd.to_datetime(row['Arrival_Date']).replace(day=1)
-            month_data = group[pd.to_datetime(group['Arrival_Date']).dt.to_period('M') == 
-                              pd.to_datetime(month_start).to_period('M')]
-            monthly_avg = month_data['Modal_Price'].mean()
-            
-            # Calculate price trend (over last 30 days)
-            date = pd.to_datetime(row['Arrival_Date'])
-            last_30_days = group[
-                (pd.to_datetime(group['Arrival_Date']) <= date) & 
-                (pd.to_datetime(group['Arrival_Date']) > date - timedelta(days=30))
-            ]
-            if len(last_30_days) > 1:
-                trend = (last_30_days['Modal_Price'].iloc[-1] - 
-                        last_30_days['Modal_Price'].iloc[0]) / last_30_days['Modal_Price'].iloc[0]
-            else:
-                trend = 0
-            
-            # Calculate seasonal index
-            yearly_avg = group[
-                pd.to_datetime(group['Arrival_Date']).dt.year == 
-                pd.to_datetime(row['Arrival_Date']).year
-            ]['Modal_Price'].mean()
-            seasonal_index = row['Modal_Price'] / yearly_avg if yearly_avg else 1
-            
-            # Calculate price volatility
-            volatility = last_30_days['Modal_Price'].std() if len(last_30_days) > 1 else 0
-            
-            transformed_data.append({
-                'state': state,
-                'district': district,
-                'market': market,
-                'commodity': commodity,
-                'variety': row['Variety'],
-                'arrival_date': row['Arrival_Date'],
-                'price_per_quintal': row['Modal_Price'],
-                'monthly_avg_price': monthly_avg,
-                'price_trend_indicator': trend,
-                'seasonal_index': seasonal_index,
-                'price_volatility': volatility
-            })
-    
-    # Save transformed data
-    transformed_df = pd.DataFrame(transformed_data)
-    transformed_df.to_sql('transformed_crop_prices', target_conn, if_exists='replace', index=False)
+
+    # Stream the table in pages ordered by the grouping key, so peak
+    # memory stays at one page instead of the whole table. Because the
+    # order is global, each group occupies a contiguous offset range;
+    # a group that runs past the page end is carried into the next page
+    base_query = (
+        "SELECT * FROM crop_prices "
+        "ORDER BY State, District, Market, Commodity, Arrival_Date "
+        f"LIMIT {CROP_PAGE_SIZE} OFFSET {{offset}}"
+    )
+
+    carry = None
+    offset = 0
+    if_exists = 'replace'
+    while True:
+        data = federator.query_server(crop_server, base_query.format(offset=offset))
+
+        if data is None:
+            console.print("[bold red]Failed to fetch crop prices data from the server[/bold red]")
+            return
+
+        page = pd.DataFrame(data)
+        if carry is not None:
+            page = pd.concat([carry, page], ignore_index=True)
+            carry = None
+
+        if len(data) == CROP_PAGE_SIZE:
+            # Hold back the trailing (possibly incomplete) group; split
+            # on the server's row order, which keeps groups contiguous
+            group_id = page[CROP_GROUP_KEYS].ne(page[CROP_GROUP_KEYS].shift()).any(axis=1).cumsum()
+            carry = page[group_id == group_id.iloc[-1]]
+            page = page[group_id < group_id.iloc[-1]]
+            if page.empty:
+                # A single group larger than the page; keep accumulating
+                offset += CROP_PAGE_SIZE
+                continue
+
+        if not page.empty:
+            transformed_df = compute_price_analytics(page)
+            # One transaction per batch, multi-row VALUES batches; 80
+            # rows of 11 columns stays under SQLite's 999-parameter limit
+            with target_conn:
+                transformed_df.to_sql('transformed_crop_prices', target_conn, if_exists=if_exists,
+                                      index=False, method='multi', chunksize=80)
+            if_exists = 'append'
+
+        if len(data) < CROP_PAGE_SIZE:
+            break
+        offset += CROP_PAGE_SIZE
 
 def transform_irrigation_data(federator, irr_server, target_conn):
     """Transform irrigation data with additional analytics"""
@@ -173,57 +224,43 @@ def transform_irrigation_data(federator, irr_server, target_conn):
         console.print("[bold red]Failed to fetch irrigation data from the server[/bold red]")
         return
     
-    # Convert to DataFrame
+    # Convert to DataFrame and sort so shift() sees consecutive years
+    # within each state
     df = pd.DataFrame(data)
-    
-    transformed_data = []
-    
-    # Group by state
-    for state, group in df.groupby('State_Name'):
-        # Sort by year
-        group = group.sort_values('Year')
-        
-        for _, row in group.iterrows():
-            # Calculate total irrigated area by summing all crop-specific areas
-            crop_columns = [col for col in df.columns if 'IRRIGATED_AREA' in col]
-            
-            # Convert each column to numeric before summing
-            total_area = sum(pd.to_numeric(row[col], errors='coerce') or 0 for col in crop_columns)
-            
-            # Since we don't have source-wise breakup, we'll set these to 0 or remove them
-            canal_pct = 0
-            tank_pct = 0
-            tubewell_pct = 0
-            other_pct = 100  # Or set to 0 if you prefer
-            
-            # Calculate growth rate
-            prev_year = group[group['Year'] == row['Year'] - 1]
-            if not prev_year.empty:
-                prev_total = sum(pd.to_numeric(prev_year.iloc[0][col], errors='coerce') or 0 
-                               for col in crop_columns)
-                growth_rate = ((total_area - prev_total) / prev_total * 100) if prev_total else 0
-            else:
-                growth_rate = 0
-            
-            # Since we don't have source diversity, we'll set this to 0
-            diversity_score = 0
-            
-            transformed_data.append({
-                'state': state,
-                'year': row['Year'],
-                'total_irrigated_area': total_area,
-                'canal_percentage': canal_pct,
-                'tank_percentage': tank_pct,
-                'tubewell_percentage': tubewell_pct,
-                'other_sources_percentage': other_pct,
-                'irrigation_coverage_ratio': 0,  # We don't have this data
-                'irrigation_growth_rate': growth_rate,
-                'water_source_diversity_score': diversity_score
-            })
-    
-    # Save transformed data
-    transformed_df = pd.DataFrame(transformed_data)
-    transformed_df.to_sql('transformed_irrigation', target_conn, if_exists='replace', index=False)
+    df = df.sort_values(['State_Name', 'Year']).reset_index(drop=True)
+
+    # Calculate total irrigated area by coercing every crop-specific
+    # column to numeric once and summing across columns in one pass
+    crop_columns = [col for col in df.columns if 'IRRIGATED_AREA' in col]
+    total_area = df[crop_columns].apply(pd.to_numeric, errors='coerce').fillna(0).sum(axis=1)
+
+    # Growth rate against the previous year of the same state; only
+    # counts when the years are consecutive, like the old Year-1 lookup
+    prev_total = total_area.groupby(df['State_Name']).shift()
+    prev_year = df.groupby('State_Name')['Year'].shift()
+    consecutive = (df['Year'] - prev_year == 1) & (prev_total > 0)
+    growth_rate = np.where(consecutive, (total_area - prev_total) / prev_total * 100, 0.0)
+
+    # Source-wise breakup, coverage and diversity are not in the data;
+    # keep the same placeholder values as before
+    n_rows = len(df)
+    transformed_df = pd.DataFrame({
+        'state': df['State_Name'],
+        'year': df['Year'],
+        'total_irrigated_area': total_area,
+        'canal_percentage': np.zeros(n_rows),
+        'tank_percentage': np.zeros(n_rows),
+        'tubewell_percentage': np.zeros(n_rows),
+        'other_sources_percentage': np.full(n_rows, 100.0),
+        'irrigation_coverage_ratio': np.zeros(n_rows),
+        'irrigation_growth_rate': growth_rate,
+        'water_source_diversity_score': np.zeros(n_rows)
+    })
+
+    # Save transformed data in one transaction with multi-row batches
+    with target_conn:
+        transformed_df.to_sql('transformed_irrigation', target_conn, if_exists='replace',
+                              index=False, method='multi', chunksize=90)
 
 def main():
     # Validate environment variables
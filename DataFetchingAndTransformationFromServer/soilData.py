@@ -1,5 +1,6 @@
 import sqlite3
 import pandas as pd
+import numpy as np
 import os
 from rich.console import Console
 
@@ -82,10 +83,26 @@ def transform_soil_data(macro_conn, micro_conn, target_conn):
     print("\nSample micro values:")
     print(micro_df[['copper_sufficient', 'copper_deficient']].head(1))
     
-    # Process each block's data
-    transformed_data = []
-    
-    for block in macro_df['block'].unique():
+    # Process each block's data into preallocated column arrays
+    # (building the frame column-wise skips pandas' slow list-of-dicts path)
+    unique_blocks = macro_df['block'].unique()
+    n_blocks = len(unique_blocks)
+
+    blocks = []
+    states = []
+    districts = []
+    ec_levels = []
+    ph_levels = []
+    numeric_columns = [
+        'nitrogen_level', 'phosphorous_level', 'potassium_level',
+        'organic_carbon_level',
+        'copper_availability', 'boron_availability', 'sulphur_availability',
+        'iron_availability', 'zinc_availability', 'manganese_availability',
+        'npk_score', 'micro_score', 'overall_soil_health_score'
+    ]
+    numeric_arrays = {name: np.empty(n_blocks, dtype='f8') for name in numeric_columns}
+
+    for i, block in enumerate(unique_blocks):
         macro_row = macro_df[macro_df['block'] == block].iloc[0]
         micro_row = micro_df[micro_df['block'] == block].iloc[0] if block in micro_df['block'].values else None
         
@@ -148,25 +165,43 @@ def transform_soil_data(macro_conn, micro_conn, target_conn):
         npk_score = (nitrogen_level + phosphorous_level + potassium_level) / 3
         micro_score = sum(micro_nutrients.values()) / len(micro_nutrients)
         overall_score = (npk_score * 0.6 + micro_score * 0.4)  # Weighted average
-        
-        transformed_data.append({
-            'block': block,
-            'state': macro_row['state'],
-            'district': macro_row['district'],
-            'nitrogen_level': nitrogen_level,
-            'phosphorous_level': phosphorous_level,
-            'potassium_level': potassium_level,
-            'organic_carbon_level': oc_level,
-            'ec_level': ec_level,
-            'ph_level': ph_level,
-            **micro_nutrients,
-            'npk_score': npk_score,
-            'micro_score': micro_score,
-            'overall_soil_health_score': overall_score
-        })
-    
-    # Convert to DataFrame and save to database
-    transformed_df = pd.DataFrame(transformed_data)
+
+        blocks.append(block)
+        states.append(macro_row['state'])
+        districts.append(macro_row['district'])
+        ec_levels.append(ec_level)
+        ph_levels.append(ph_level)
+        numeric_arrays['nitrogen_level'][i] = nitrogen_level
+        numeric_arrays['phosphorous_level'][i] = phosphorous_level
+        numeric_arrays['potassium_level'][i] = potassium_level
+        numeric_arrays['organic_carbon_level'][i] = oc_level
+        for name, value in micro_nutrients.items():
+            numeric_arrays[name][i] = value
+        numeric_arrays['npk_score'][i] = npk_score
+        numeric_arrays['micro_score'][i] = micro_score
+        numeric_arrays['overall_soil_health_score'][i] = overall_score
+
+    # Build the DataFrame column-wise without copying the numeric arrays
+    transformed_df = pd.DataFrame({
+        'block': blocks,
+        'state': states,
+        'district': districts,
+        'nitrogen_level': numeric_arrays['nitrogen_level'],
+        'phosphorous_level': numeric_arrays['phosphorous_level'],
+        'potassium_level': numeric_arrays['potassium_level'],
+        'organic_carbon_level': numeric_arrays['organic_carbon_level'],
+        'ec_level': ec_levels,
+        'ph_level': ph_levels,
+        'copper_availability': numeric_arrays['copper_availability'],
+        'boron_availability': numeric_arrays['boron_availability'],
+        'sulphur_availability': numeric_arrays['sulphur_availability'],
+        'iron_availability': numeric_arrays['iron_availability'],
+        'zinc_availability': numeric_arrays['zinc_availability'],
+        'manganese_availability': numeric_arrays['manganese_availability'],
+        'npk_score': numeric_arrays['npk_score'],
+        'micro_score': numeric_arrays['micro_score'],
+        'overall_soil_health_score': numeric_arrays['overall_soil_health_score']
+    }, copy=False)
     transformed_df.to_sql('soil_health', target_conn, if_exists='replace', index=False)
     
     # Print sample of transformed data
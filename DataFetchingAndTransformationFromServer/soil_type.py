@@ -2,6 +2,7 @@ import pandas as pd
 import sqlite3
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from rich.console import Console
@@ -27,6 +28,9 @@ SERVERS = [
     }
 ]
 
+# Index the configs by db_name so lookups avoid scanning SERVERS
+SERVERS_BY_NAME = {server["db_name"]: server for server in SERVERS}
+
 def validate_server_config():
     """Validate that all required environment variables are set"""
     for server in SERVERS:
@@ -36,22 +40,25 @@ def validate_server_config():
                 "Please check your .env file."
             )
 
+@lru_cache(maxsize=1)
+def get_federator():
+    """Validate the config once and reuse a single DatabaseFederator"""
+    validate_server_config()
+    return DatabaseFederator(SERVERS)
+
 def fetch_and_transform_soil_data():
     """Fetch and transform soil types data"""
     try:
         # Get soil types server config
-        soil_server = next(
-            (server for server in SERVERS if server["db_name"] == "soil_types"),
-            None
-        )
-        
+        soil_server = SERVERS_BY_NAME.get("soil_types")
+
         if not soil_server:
             print("Error: Soil types server configuration not found")
             return
-        
-        # Initialize federator
-        federator = DatabaseFederator(SERVERS)
-        
+
+        # Reuse the cached federator
+        federator = get_federator()
+
         # Fetch soil types data
         query = "SELECT * FROM soil_types"
         data = federator.query_server(soil_server, query)
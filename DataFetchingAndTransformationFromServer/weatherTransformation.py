@@ -38,9 +38,30 @@ def create_transformed_database():
     conn.commit()
     return conn
 
+def prepare_source_indexes(source_conn):
+    """Create join indexes and statistics on the source weather tables"""
+    cursor = source_conn.cursor()
+
+    # Without these indexes SQLite scans hourly_weather for every daily row
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_hw_loc_date
+    ON hourly_weather(location_id, date(timestamp))
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_dw_loc_date
+    ON daily_weather(location_id, date)
+    ''')
+
+    # Refresh planner statistics so the join uses the indexes
+    cursor.execute('ANALYZE')
+    source_conn.commit()
+
 def transform_weather_data(source_conn, target_conn):
     """Transform and combine weather metrics into agricultural insights"""
-    
+
+    # Index the source tables before running the join-heavy transform
+    prepare_source_indexes(source_conn)
+
     # Join daily weather with location and hourly soil data
     query = '''
     WITH daily_metrics AS (
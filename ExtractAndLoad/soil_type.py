@@ -1,6 +1,7 @@
 import pandas as pd
 import sqlite3
 import os
+from functools import lru_cache
 
 def clean_column_name(name):
     """Clean column names to make them SQL friendly"""
@@ -9,23 +10,33 @@ def clean_column_name(name):
 def load_soil_types():
     """Load soil types data into SQLite database"""
     try:
-        # Read CSV file
-        df = pd.read_csv('rawData/soil_types_india.csv')
-        
+        # Read only the columns we use, with explicit dtypes so pandas
+        # skips its type-inference pass
+        df = pd.read_csv(
+            'rawData/soil_types_india.csv',
+            usecols=['Sl.No', 'Soil Type', 'Found in', 'Facts'],
+            dtype={'Sl.No': 'int32', 'Soil Type': 'string',
+                   'Found in': 'string', 'Facts': 'string'}
+        )
+
         # Clean column names
         df.columns = [clean_column_name(col) for col in df.columns]
         
         # Split the 'found_in' column into a separate states table
-        states_data = []
-        for idx, row in df.iterrows():
-            states = [state.strip() for state in row['found_in'].split(',')]
-            for state in states:
-                states_data.append({
-                    'soil_type_id': idx + 1,  # Adding 1 because idx starts at 0
-                    'state': state
-                })
-        
-        states_df = pd.DataFrame(states_data)
+        # (vectorized split + explode instead of a per-row Python loop)
+        states_df = (
+            df['found_in']
+            .str.split(',')
+            .explode()
+            .str.strip()
+            .rename('state')
+            .reset_index()
+            .rename(columns={'index': 'soil_type_id'})
+        )
+        states_df['soil_type_id'] += 1  # Adding 1 because the index starts at 0
+
+        # Deduplicate here so the database load needs no uniqueness checks
+        states_df = states_df.drop_duplicates(['soil_type_id', 'state']).reset_index(drop=True)
         
         return df, states_df
     
@@ -55,11 +66,10 @@ def create_database():
         # Create soil_type_states table for many-to-many relationship
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS soil_type_states (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             soil_type_id INTEGER,
             state TEXT NOT NULL,
-            FOREIGN KEY (soil_type_id) REFERENCES soil_types (id),
-            UNIQUE (soil_type_id, state)
+            FOREIGN KEY (soil_type_id) REFERENCES soil_types (id)
         )
         ''')
         
@@ -71,8 +81,10 @@ def create_database():
             soil_types_data = soil_types_df[['slno', 'soil_type', 'facts']].rename(columns={'slno': 'id'})
             soil_types_data.to_sql('soil_types', conn, if_exists='replace', index=False)
             
-            # Insert states data
-            states_df.to_sql('soil_type_states', conn, if_exists='replace', index=False)
+            # Insert states data with multi-row VALUES batches; the frame is
+            # already deduplicated so no per-row conflict checks are needed
+            states_df.to_sql('soil_type_states', conn, if_exists='replace', index=False,
+                             method='multi', chunksize=500)
             
             # Create indexes for better query performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_soil_type_states_state ON soil_type_states(state)')
@@ -94,24 +106,31 @@ def create_database():
     except Exception as e:
         print(f"Error creating soil types database: {str(e)}")
 
+SOIL_TYPES_BY_STATE_SQL = '''
+SELECT st.soil_type, st.facts
+FROM soil_types st
+JOIN soil_type_states sts ON st.id = sts.soil_type_id
+WHERE sts.state = ?
+'''
+
+@lru_cache(maxsize=1)
+def _get_query_connection():
+    """Open the soil types database once with read-friendly PRAGMAs"""
+    conn = sqlite3.connect('database/soil_types.db', check_same_thread=False)
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA cache_size=-20000')
+    return conn
+
+@lru_cache(maxsize=256)
 def query_soil_types_by_state(state):
     """Helper function to query soil types for a specific state"""
     try:
-        conn = sqlite3.connect('database/soil_types.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-        SELECT st.soil_type, st.facts 
-        FROM soil_types st
-        JOIN soil_type_states sts ON st.id = sts.soil_type_id
-        WHERE sts.state = ?
-        ''', (state,))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        return results
-    
+        # Reuse the cached connection; repeat queries for the same state
+        # are answered straight from the lru_cache
+        conn = _get_query_connection()
+        cursor = conn.execute(SOIL_TYPES_BY_STATE_SQL, (state,))
+        return cursor.fetchall()
+
     except Exception as e:
         print(f"Error querying soil types: {str(e)}")
         return []
@@ -6,24 +6,51 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, StaleElementReferenceException
+import atexit
+import io
 import os
 import time
 import logging
 import sys
-from selenium.webdriver import ActionChains
-from selenium.webdriver.common.keys import Keys
+import tempfile
+from functools import lru_cache
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from geopy.geocoders import Nominatim
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def wait_for_element(driver, by, value, timeout=20, condition="clickable"):
+# Locators used by the scraper; CSS where possible since Chrome's CSS
+# engine resolves them faster than contains() xpaths
+MENU_ITEM_CSS = "li.MuiMenuItem-root"
+TAB_XPATH_TEMPLATE = "//button[contains(@class, 'MuiTab-root') and contains(text(), '{tab_name}')]"
+ANY_TAB_XPATH = "//button[contains(@class, 'MuiTab-root')]"
+STATE_XPATH = "//div[contains(@class, 'MuiFormControl-root')]//div[contains(@class, 'MuiSelect-select') and contains(@class, 'MuiOutlinedInput-input') and contains(text(), 'Select a state')]"
+DISTRICT_XPATH = "//div[@class='MuiSelect-select MuiSelect-outlined MuiInputBase-input MuiOutlinedInput-input css-qiwgdb' and @role='combobox' and contains(text(), 'Select a district')]"
+EXPORT_BUTTON_CSS = "a.downloadbtn[download='my-file.csv']"
+
+# Browser binaries, overridable per deployment and validated once at
+# import instead of two stat calls per driver launch
+BRAVE_PATH = os.environ.get(
+    'BRAVE_PATH',
+    r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe")
+CHROMEDRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH', r"C:\ChromeDriver\chromedriver.exe")
+_BRAVE_AVAILABLE = os.path.exists(BRAVE_PATH)
+_CHROMEDRIVER_AVAILABLE = os.path.exists(CHROMEDRIVER_PATH)
+
+def wait_for_element(driver, by, value, timeout=10, condition="clickable", poll_frequency=0.1):
     """Wait for and return an element."""
-    wait = WebDriverWait(driver, timeout)
+    # A 0.1 s poll retries known-fast conditions ~5x sooner than the
+    # WebDriverWait default of 0.5 s
+    wait = WebDriverWait(driver, timeout, poll_frequency=poll_frequency)
     try:
         if condition == "clickable":
             element = wait.until(EC.element_to_be_clickable((by, value)))
@@ -40,13 +67,33 @@ def wait_for_element(driver, by, value, timeout=20, condition="clickable"):
         logger.error(f"Element became stale: {value}")
         raise
 
+def char_mask(s):
+    """Build a 128-bit character-presence mask for a string."""
+    mask = 0
+    for c in s.lower():
+        mask |= 1 << (ord(c) & 127)
+    return mask
+
+def mask_jaccard_similarity(mask1, mask2):
+    """Calculate Jaccard similarity between two character masks."""
+    union = (mask1 | mask2).bit_count()
+    return (mask1 & mask2).bit_count() / union if union != 0 else 0
+
 def calculate_jaccard_similarity(str1, str2):
     """Calculate Jaccard similarity between two strings."""
-    set1 = set(str1.lower())
-    set2 = set(str2.lower())
-    intersection = len(set1.intersection(set2))
-    union = len(set1.union(set2))
-    return intersection / union if union != 0 else 0
+    # Bitmask intersection/union instead of per-call Python set objects
+    return mask_jaccard_similarity(char_mask(str1), char_mask(str2))
+
+# Option texts repeat across tabs/dropdowns, so cache their masks
+_option_mask_cache = {}
+
+def cached_char_mask(text):
+    """Return the character mask for text, memoized across dropdown calls."""
+    mask = _option_mask_cache.get(text)
+    if mask is None:
+        mask = char_mask(text)
+        _option_mask_cache[text] = mask
+    return mask
 
 def select_from_mui_dropdown(driver, dropdown_selector, target_text, is_xpath=True):
     """Helper function to select an option from a MUI dropdown with fuzzy matching."""
@@ -59,32 +106,30 @@ def select_from_mui_dropdown(driver, dropdown_selector, target_text, is_xpath=Tr
             condition="clickable"
         )
         
-        # Try multiple methods to open the dropdown
-        try:
-            dropdown.click()
-        except:
-            try:
-                driver.execute_script("arguments[0].click();", dropdown)
-            except:
-                try:
-                    actions = ActionChains(driver)
-                    actions.move_to_element(dropdown).click().perform()
-                except:
-                    dropdown.send_keys(Keys.SPACE)
-        
-        time.sleep(1)  # Wait for dropdown animation
-        
-        # Get all options and find best match
-        options = driver.find_elements(By.XPATH, "//li[contains(@class, 'MuiMenuItem-root')]")
+        # A JS click bypasses overlay interception, so a single call opens
+        # every MUI dropdown without the native-click fallback chain
+        driver.execute_script("arguments[0].click();", dropdown)
+
+        # Poll until the dropdown options render instead of a fixed sleep
+        WebDriverWait(driver, 10, poll_frequency=0.1).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, MENU_ITEM_CSS))
+        )
+
+        # Get all options and their texts in one round-trip, then score
+        # against cached masks instead of re-querying each option
+        options = driver.find_elements(By.CSS_SELECTOR, MENU_ITEM_CSS)
+        option_texts = driver.execute_script(
+            "return arguments[0].map(el => el.textContent.trim());", options
+        )
         best_match = None
         best_similarity = -1
-        
+        target_mask = char_mask(target_text)
+
         logger.info("Available options in dropdown:")
-        for option in options:
-            option_text = option.text.strip()
-            similarity = calculate_jaccard_similarity(target_text, option_text)
-            logger.info(f"- {option_text} (data-value: {option.get_attribute('data-value')}) [similarity: {similarity:.3f}]")
-            
+        for option, option_text in zip(options, option_texts):
+            similarity = mask_jaccard_similarity(target_mask, cached_char_mask(option_text))
+            logger.info(f"- {option_text} [similarity: {similarity:.3f}]")
+
             if similarity > best_similarity:
                 best_similarity = similarity
                 best_match = option
@@ -101,14 +146,77 @@ def select_from_mui_dropdown(driver, dropdown_selector, target_text, is_xpath=Tr
         logger.error(f"Failed to select from dropdown: {str(e)}")
         return False
 
+class _DownloadHandler(FileSystemEventHandler):
+    """Signal an event as soon as the expected download file appears."""
+
+    def __init__(self, expected_file, event):
+        self.expected_file = expected_file
+        self.event = event
+
+    def _check(self, path):
+        if os.path.normpath(path) == os.path.normpath(self.expected_file):
+            self.event.set()
+
+    def on_created(self, event):
+        self._check(event.src_path)
+
+    def on_moved(self, event):
+        # Chrome renames the .crdownload file when the download completes
+        self._check(event.dest_path)
+
+def wait_for_download(download_dir, expected_file, timeout=30):
+    """Block until expected_file appears in download_dir, without polling."""
+    done = threading.Event()
+    observer = Observer()
+    observer.schedule(_DownloadHandler(expected_file, done), download_dir)
+    observer.start()
+    try:
+        # Handle the race where the file landed before the observer started
+        if os.path.exists(expected_file):
+            return True
+        return done.wait(timeout=timeout)
+    finally:
+        observer.stop()
+        observer.join()
+
+# One chromedriver process serves every browser session; starting it
+# per driver charged its cold start to each scrape
+_driver_service = None
+_service_lock = threading.Lock()
+
+def _get_driver_service():
+    """Start the shared ChromeDriver service once and reuse it."""
+    global _driver_service
+    with _service_lock:
+        if _driver_service is None:
+            if not _CHROMEDRIVER_AVAILABLE:
+                logger.error(f"ChromeDriver not found at: {CHROMEDRIVER_PATH}")
+                raise FileNotFoundError(f"ChromeDriver not found at: {CHROMEDRIVER_PATH}")
+            service = Service(executable_path=CHROMEDRIVER_PATH)
+            service.start()
+            atexit.register(service.stop)
+            _driver_service = service
+        return _driver_service
+
+# Decorative subresources the scraper never reads; blocking them keeps
+# navigation to the DOM we actually interact with
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.woff*',
+    '*google-analytics*', '*googletagmanager*',
+]
+
 def setup_driver(download_dir):
     """Set up and return the Chrome WebDriver with appropriate options."""
     options = Options()
+    # The piechart app is a MUI SPA; its controls are interactable at
+    # DOMContentLoaded, so don't wait for every subresource to finish
+    options.page_load_strategy = 'eager'
     options.add_argument('--headless')  # Enable headless mode
     options.add_argument('--disable-gpu')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--window-size=1920,1080')
+    options.add_argument('--blink-settings=imagesEnabled=false')
     
     # Configure download settings 
     prefs = {
@@ -121,171 +229,230 @@ def setup_driver(download_dir):
     options.add_experimental_option("prefs", prefs)
     
     # Specify Brave browser binary location
-    brave_path = r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe"
-    if not os.path.exists(brave_path):
-        logger.error(f"Brave browser not found at: {brave_path}")
-        raise FileNotFoundError(f"Brave browser not found at: {brave_path}")
-    options.binary_location = brave_path
-    
-    # Set up ChromeDriver service
-    chromedriver_path = r"C:\ChromeDriver\chromedriver.exe"
-    if not os.path.exists(chromedriver_path):
-        logger.error(f"ChromeDriver not found at: {chromedriver_path}")
-        raise FileNotFoundError(f"ChromeDriver not found at: {chromedriver_path}")
-    service = Service(executable_path=chromedriver_path)
-    
+    if not _BRAVE_AVAILABLE:
+        logger.error(f"Brave browser not found at: {BRAVE_PATH}")
+        raise FileNotFoundError(f"Brave browser not found at: {BRAVE_PATH}")
+    options.binary_location = BRAVE_PATH
+
+    # Attach a new session to the shared ChromeDriver service instead
+    # of spawning a chromedriver process per browser
+    service = _get_driver_service()
+
     try:
-        driver = webdriver.Chrome(service=service, options=options)
+        driver = webdriver.Remote(command_executor=service.service_url, options=options)
+        # Block images/fonts/analytics at the network layer too; plain
+        # Remote sessions don't expose the CDP endpoint, so skip quietly
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs',
+                                   {'urls': _BLOCKED_URL_PATTERNS})
         return driver
     except WebDriverException as e:
         logger.error(f"Failed to initialize WebDriver: {str(e)}")
         raise
 
+# Schema DDL runs once per process; later create_databases calls skip
+# the re-parse entirely
+_schema_ready = False
+
+# Lookups from the transformation stage filter on state and district,
+# so each schema indexes them up front while the table is small
+_MACRO_SCHEMA_DDL = '''
+    CREATE TABLE IF NOT EXISTS macro_nutrients (
+        id INTEGER PRIMARY KEY,
+        block TEXT,
+        nitrogen_high REAL,
+        nitrogen_medium REAL,
+        nitrogen_low REAL,
+        phosphorous_high REAL,
+        phosphorous_medium REAL,
+        phosphorous_low REAL,
+        potassium_high REAL,
+        potassium_medium REAL,
+        potassium_low REAL,
+        oc_high REAL,
+        oc_medium REAL,
+        oc_low REAL,
+        ec_saline REAL,
+        ec_non_saline REAL,
+        ph_acidic REAL,
+        ph_neutral REAL,
+        ph_alkaline REAL,
+        state TEXT,
+        district TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS ix_macro_state_district
+    ON macro_nutrients(state, district);
+'''
+
+_MICRO_SCHEMA_DDL = '''
+    CREATE TABLE IF NOT EXISTS micro_nutrients (
+        id INTEGER PRIMARY KEY,
+        block TEXT,
+        copper_sufficient REAL,
+        copper_deficient REAL,
+        boron_sufficient REAL,
+        boron_deficient REAL,
+        sulphur_sufficient REAL,
+        sulphur_deficient REAL,
+        iron_sufficient REAL,
+        iron_deficient REAL,
+        zinc_sufficient REAL,
+        zinc_deficient REAL,
+        manganese_sufficient REAL,
+        manganese_deficient REAL,
+        state TEXT,
+        district TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS ix_micro_state_district
+    ON micro_nutrients(state, district);
+'''
+
 def create_databases():
     """Create separate SQLite databases for macro and micro nutrients"""
+    global _schema_ready
     try:
         # Create database directory if it doesn't exist
         db_path = os.path.join(os.getcwd(), 'database')
         if not os.path.exists(db_path):
             os.makedirs(db_path)
             logger.info("Created database directory")
-        
-        # Create macro nutrients database
+
         macro_conn = sqlite3.connect('database/macro_nutrients.db')
-        macro_cursor = macro_conn.cursor()
-        
-        macro_cursor.execute('''
-            CREATE TABLE IF NOT EXISTS macro_nutrients (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block TEXT,
-                nitrogen_high REAL,
-                nitrogen_medium REAL,
-                nitrogen_low REAL,
-                phosphorous_high REAL,
-                phosphorous_medium REAL,
-                phosphorous_low REAL,
-                potassium_high REAL,
-                potassium_medium REAL,
-                potassium_low REAL,
-                oc_high REAL,
-                oc_medium REAL,
-                oc_low REAL,
-                ec_saline REAL,
-                ec_non_saline REAL,
-                ph_acidic REAL,
-                ph_neutral REAL,
-                ph_alkaline REAL,
-                state TEXT,
-                district TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        macro_conn.commit()
-        
-        # Create micro nutrients database
         micro_conn = sqlite3.connect('database/micro_nutrients.db')
-        micro_cursor = micro_conn.cursor()
-        
-        micro_cursor.execute('''
-            CREATE TABLE IF NOT EXISTS micro_nutrients (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block TEXT,
-                copper_sufficient REAL,
-                copper_deficient REAL,
-                boron_sufficient REAL,
-                boron_deficient REAL,
-                sulphur_sufficient REAL,
-                sulphur_deficient REAL,
-                iron_sufficient REAL,
-                iron_deficient REAL,
-                zinc_sufficient REAL,
-                zinc_deficient REAL,
-                manganese_sufficient REAL,
-                manganese_deficient REAL,
-                state TEXT,
-                district TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        micro_conn.commit()
-        
+        if _schema_ready:
+            return macro_conn, micro_conn
+
+        # One executescript per database parses and commits the whole
+        # DDL block in a single call
+        macro_conn.executescript(_MACRO_SCHEMA_DDL)
+        micro_conn.executescript(_MICRO_SCHEMA_DDL)
+
+        _schema_ready = True
         logger.info("Databases and tables created/verified successfully")
         return macro_conn, micro_conn
     except Exception as e:
         logger.error(f"Error creating databases: {str(e)}")
         raise
 
+# One ingest connection per database for the whole run; reopening per
+# CSV re-parsed the schema and redid the PRAGMA setup each time
+_nutrient_connections = {}
+_conn_lock = threading.Lock()
+
+def get_nutrient_connection(db_name):
+    """Return the cached ingest connection for db_name, opening it once."""
+    with _conn_lock:
+        conn = _nutrient_connections.get(db_name)
+        if conn is None:
+            # The write lock serializes use across scrape threads
+            conn = sqlite3.connect(f'database/{db_name}', check_same_thread=False)
+            # Speed up the bulk loads: WAL journal, no per-insert fsync,
+            # and spill-free sorting/caching in memory
+            conn.executescript('''
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=OFF;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-65536;
+            ''')
+            _nutrient_connections[db_name] = conn
+        return conn
+
+def close_nutrient_connections():
+    """Close the cached ingest connections (registered at exit)."""
+    with _conn_lock:
+        for conn in _nutrient_connections.values():
+            conn.close()
+        _nutrient_connections.clear()
+
+atexit.register(close_nutrient_connections)
+
+def read_nutrient_csv(csv_source):
+    """Parse a nutrient CSV with Arrow's multithreaded reader when available."""
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(csv_source)
+    if isinstance(csv_source, io.StringIO):
+        csv_source = io.BytesIO(csv_source.getvalue().encode('utf-8'))
+    return pacsv.read_csv(csv_source).to_pandas()
+
 def store_csv_to_database(csv_path, state, district):
     """Store CSV data in appropriate SQLite database"""
+    # Determine if this is macro or micro data based on filename
+    data_type = "macro" if "macro" in csv_path.lower() else "micro"
+    logger.info(f"Processing file: {csv_path}")
+    return store_dataframe_to_database(read_nutrient_csv(csv_path), data_type, state, district)
+
+def store_dataframe_to_database(df, data_type, state, district):
+    """Store nutrient DataFrame in the appropriate SQLite database"""
     try:
-        # Read CSV file
-        df = pd.read_csv(csv_path)
-        
         # Debug logging to check the data being processed
-        logger.info(f"Processing file: {csv_path}")
         logger.info(f"DataFrame columns: {df.columns.tolist()}")
-        
-        # Determine if this is macro or micro data based on filename
-        is_macro = "macro" in csv_path.lower()
+
+        is_macro = data_type == "macro"
         logger.info(f"Is macro data: {is_macro}")
-        
-        # Connect to appropriate database
+
+        # Reuse the cached ingest connection for this database
         db_name = "macro_nutrients.db" if is_macro else "micro_nutrients.db"
-        conn = sqlite3.connect(f'database/{db_name}')
+        conn = get_nutrient_connection(db_name)
         cursor = conn.cursor()
-        
+
         # Debug logging for database connection
         logger.info(f"Connected to database: {db_name}")
-        
-        # Process each row in the DataFrame
-        for index, row in df.iterrows():
-            # Debug first row
-            if index == 0:
-                logger.info(f"Sample row data: {row.to_dict()}")
-            
-            # Remove the % symbol and convert to float
-            values = [float(str(v).replace('%', '')) / 100 if isinstance(v, str) and '%' in str(v) else v 
-                     for v in row.values[1:]]  # Skip the 'Block' column
-            
-            if is_macro:
-                try:
-                    cursor.execute('''
-                        INSERT INTO macro_nutrients (
-                            block, nitrogen_high, nitrogen_medium, nitrogen_low,
-                            phosphorous_high, phosphorous_medium, phosphorous_low,
-                            potassium_high, potassium_medium, potassium_low,
-                            oc_high, oc_medium, oc_low,
-                            ec_saline, ec_non_saline,
-                            ph_acidic, ph_neutral, ph_alkaline,
-                            state, district
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (row['Block'], *values, state, district))
-                    if index == 0:
-                        logger.info("Successfully inserted first macro row")
-                except Exception as e:
-                    logger.error(f"Error inserting macro row {index}: {str(e)}")
-                    logger.error(f"Values being inserted: {[row['Block'], *values, state, district]}")
-            else:
-                try:
-                    cursor.execute('''
-                        INSERT INTO micro_nutrients (
-                            block, copper_sufficient, copper_deficient,
-                            boron_sufficient, boron_deficient,
-                            sulphur_sufficient, sulphur_deficient,
-                            iron_sufficient, iron_deficient,
-                            zinc_sufficient, zinc_deficient,
-                            manganese_sufficient, manganese_deficient,
-                            state, district
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (row['Block'], *values, state, district))
-                    if index == 0:
-                        logger.info("Successfully inserted first micro row")
-                except Exception as e:
-                    logger.error(f"Error inserting micro row {index}: {str(e)}")
-                    logger.error(f"Values being inserted: {[row['Block'], *values, state, district]}")
-        
-        conn.commit()
-        conn.close()
+
+        if is_macro:
+            insert_sql = '''
+                INSERT INTO macro_nutrients (
+                    block, nitrogen_high, nitrogen_medium, nitrogen_low,
+                    phosphorous_high, phosphorous_medium, phosphorous_low,
+                    potassium_high, potassium_medium, potassium_low,
+                    oc_high, oc_medium, oc_low,
+                    ec_saline, ec_non_saline,
+                    ph_acidic, ph_neutral, ph_alkaline,
+                    state, district
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            '''
+        else:
+            insert_sql = '''
+                INSERT INTO micro_nutrients (
+                    block, copper_sufficient, copper_deficient,
+                    boron_sufficient, boron_deficient,
+                    sulphur_sufficient, sulphur_deficient,
+                    iron_sufficient, iron_deficient,
+                    zinc_sufficient, zinc_deficient,
+                    manganese_sufficient, manganese_deficient,
+                    state, district
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            '''
+
+        # Strip the % symbols column-wise instead of per cell
+        percent_cols = df.columns.drop('Block')
+        obj_cols = df[percent_cols].select_dtypes(include='object').columns
+        if len(obj_cols) > 0:
+            df[obj_cols] = df[obj_cols].apply(
+                lambda s: pd.to_numeric(s.str.rstrip('%'), errors='coerce') / 100
+            )
+
+        # Build all rows up front for the batch insert
+        rows = [(raw[0], *raw[1:], state, district)
+                for raw in df.itertuples(index=False, name=None)]
+
+        if rows:
+            logger.info(f"Sample row data: {rows[0]}")
+
+        # Insert everything in one batch inside a single transaction
+        try:
+            cursor.execute("BEGIN")
+            cursor.executemany(insert_sql, rows)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error batch inserting rows: {str(e)}")
+            return False
+
         logger.info(f"Successfully stored data for {len(df)} blocks in {db_name}")
         return True
         
@@ -293,133 +460,148 @@ def store_csv_to_database(csv_path, state, district):
         logger.error(f"Error storing data in database: {str(e)}")
         return False
 
-def download_soil_health_data(state="ANDHRA PRADESH", district="ANANTAPUR", download_dir=None):
-    """Main function to download soil health data and store in database"""
-    driver = None
+# Serialize SQLite writes from the parallel scrape threads
+_db_write_lock = threading.Lock()
+
+def scrape_tab(driver, tab_name, data_type, state, district):
+    """Scrape one nutrient tab in the given browser and store the CSV."""
     try:
-        # Set up download directory
-        if download_dir is None:
-            download_dir = os.path.join(os.getcwd(), "temp_downloads")
-        os.makedirs(download_dir, exist_ok=True)
-        logger.info(f"Download directory set to: {download_dir}")
-        
-        # Clear existing files in download directory
-        for file in os.listdir(download_dir):
-            file_path = os.path.join(download_dir, file)
-            try:
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-            except Exception as e:
-                logger.warning(f"Error deleting file {file_path}: {str(e)}")
-        
-        logger.info("Initializing WebDriver...")
-        driver = setup_driver(download_dir)
-        
         logger.info("Navigating to website...")
         driver.get('https://soilhealth.dac.gov.in/piechart')
-        time.sleep(5)  # Wait for page load
-        
-        # Process both MacroNutrient and MicroNutrient tabs
-        tabs = [
-            ("MacroNutrient(% View)", "macro"),
-            ("MicroNutrient(% View)", "micro")
-        ]
-        
-        for tab_name, data_type in tabs:
-            logger.info(f"Processing {tab_name} tab...")
-            
-            # Click on the appropriate tab
-            tab = wait_for_element(
-                driver, 
-                By.XPATH, 
-                f"//button[contains(@class, 'MuiTab-root') and contains(text(), '{tab_name}')]"
-            )
-            driver.execute_script("arguments[0].click();", tab)
-            logger.info(f"Clicked on {tab_name} tab")
-            time.sleep(2)  # Wait for tab switch
-            
-            # Print available states before selection
-            logger.info(f"Selecting state: {state}")
-            state_xpath = "//div[contains(@class, 'MuiFormControl-root')]//div[contains(@class, 'MuiSelect-select') and contains(@class, 'MuiOutlinedInput-input') and contains(text(), 'Select a state')]"
-         
-            state_success = select_from_mui_dropdown(
-                driver,
-                state_xpath,
-                state
-            )
-            if not state_success:
-                raise Exception("Failed to select state")
-            
-            time.sleep(3)  # Wait for district dropdown
-            
-            # Select district
-            logger.info(f"Selecting district: {district}")
-            district_xpath = "//div[@class='MuiSelect-select MuiSelect-outlined MuiInputBase-input MuiOutlinedInput-input css-qiwgdb' and @role='combobox' and contains(text(), 'Select a district')]"
-            district_success = select_from_mui_dropdown(
-                driver,
-                district_xpath,
-                district
-            )
-            if not district_success:
-                raise Exception("Failed to select district")
-            
-            time.sleep(3)  # Wait for data load
-            
-            # Click Export to CSV button
-            logger.info("Clicking 'Export to CSV' button...")
-            export_button = wait_for_element(
-                driver, 
-                By.CSS_SELECTOR,
-                "a.downloadbtn[download='my-file.csv']"
-            )
-            
-            # Get blob URL and click download
-            blob_url = export_button.get_attribute('href')
-            if not blob_url or not blob_url.startswith('blob:'):
-                raise Exception("Invalid blob URL for download")
-            
-            driver.execute_script("arguments[0].click();", export_button)
-            logger.info("Clicked 'Export to CSV' button")
-            
-            # Wait for CSV download
-            expected_file = os.path.join(download_dir, "my-file.csv")
-            timeout = 30
-            while timeout > 0 and not os.path.exists(expected_file):
-                time.sleep(1)
-                timeout -= 1
-                sys.stdout.write(f"\rWaiting for CSV download... {timeout} seconds remaining")
-                sys.stdout.flush()
-            
-            if os.path.exists(expected_file):
-                logger.info(f"\n{tab_name} CSV file downloaded successfully!")
-                # Rename file to avoid overwriting
-                new_file_name = os.path.join(download_dir, f"{data_type}_nutrients.csv")
-                os.rename(expected_file, new_file_name)
-                success = store_csv_to_database(new_file_name, state, district)
-                
-                if success:
-                    os.remove(new_file_name)
-                    logger.info(f"{tab_name} CSV file removed after database storage")
-            else:
-                logger.error("\nDownload timed out!")
-                return False
-            
-            time.sleep(2)  # Wait before switching tabs
-        
-        return True
-            
+        # Wait for the nutrient tabs to render instead of a fixed sleep
+        WebDriverWait(driver, 30, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.XPATH, ANY_TAB_XPATH))
+        )
+
+        logger.info(f"Processing {tab_name} tab...")
+
+        # Click on the appropriate tab
+        tab = wait_for_element(
+            driver,
+            By.XPATH,
+            TAB_XPATH_TEMPLATE.format(tab_name=tab_name)
+        )
+        driver.execute_script("arguments[0].click();", tab)
+        logger.info(f"Clicked on {tab_name} tab")
+
+        # Print available states before selection
+        logger.info(f"Selecting state: {state}")
+        state_success = select_from_mui_dropdown(
+            driver,
+            STATE_XPATH,
+            state
+        )
+        if not state_success:
+            raise Exception("Failed to select state")
+
+        # Select district once its dropdown becomes interactable
+        logger.info(f"Selecting district: {district}")
+        WebDriverWait(driver, 10, poll_frequency=0.1).until(
+            EC.element_to_be_clickable((By.XPATH, DISTRICT_XPATH))
+        )
+        district_success = select_from_mui_dropdown(
+            driver,
+            DISTRICT_XPATH,
+            district
+        )
+        if not district_success:
+            raise Exception("Failed to select district")
+
+        # Click Export to CSV button (wait_for_element polls until the
+        # data has loaded and the button is clickable)
+        logger.info("Clicking 'Export to CSV' button...")
+        export_button = wait_for_element(
+            driver,
+            By.CSS_SELECTOR,
+            EXPORT_BUTTON_CSS
+        )
+
+        # Get blob URL and fetch its text in-browser; this skips the
+        # download shelf, the rename and the re-read from disk entirely
+        blob_url = export_button.get_attribute('href')
+        if not blob_url or not blob_url.startswith('blob:'):
+            raise Exception("Invalid blob URL for download")
+
+        logger.info("Fetching CSV text from blob URL...")
+        csv_text = driver.execute_async_script(
+            """
+            const cb = arguments[arguments.length - 1];
+            fetch(arguments[0]).then(r => r.text()).then(cb);
+            """,
+            blob_url
+        )
+        if not csv_text:
+            raise Exception("Empty CSV content from blob URL")
+
+        logger.info(f"{tab_name} CSV content fetched successfully!")
+        df = read_nutrient_csv(io.StringIO(csv_text))
+        with _db_write_lock:
+            return store_dataframe_to_database(df, data_type, state, district)
+
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}")
+        logger.error(f"An error occurred processing {tab_name}: {str(e)}")
         return False
-    finally:
-        if driver:
+
+class SoilHealthScraper:
+    """Keep one browser per nutrient tab alive across multiple fetches."""
+
+    TABS = [
+        ("MacroNutrient(% View)", "macro"),
+        ("MicroNutrient(% View)", "micro")
+    ]
+
+    def __init__(self, download_dir):
+        self.download_dir = download_dir
+        self.drivers = {}
+
+    def __enter__(self):
+        # One browser per tab; each gets its own download subdirectory
+        # so any blob files never collide
+        for tab_name, data_type in self.TABS:
+            subdir = os.path.join(self.download_dir, data_type)
+            os.makedirs(subdir, exist_ok=True)
+            logger.info(f"Initializing WebDriver for {tab_name}...")
+            self.drivers[data_type] = setup_driver(subdir)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for data_type, driver in self.drivers.items():
             driver.quit()
-            logger.info("Browser closed")
+            logger.info(f"Browser closed for {data_type}")
+        self.drivers.clear()
+
+    def fetch(self, state, district):
+        """Scrape both nutrient tabs for one (state, district) pair."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(
+                lambda t: scrape_tab(self.drivers[t[1]], t[0], t[1], state, district),
+                self.TABS
+            ))
+        return all(results)
+
+def download_soil_health_data(state="ANDHRA PRADESH", district="ANANTAPUR", download_dir=None):
+    """Main function to download soil health data and store in database"""
+    # Use a throwaway temp directory when the caller doesn't supply one;
+    # the kernel guarantees it starts empty, so no pre-clean pass is needed
+    if download_dir is None:
+        with tempfile.TemporaryDirectory(prefix="soilhealth_") as tmp_dir:
+            return download_soil_health_data(state, district, tmp_dir)
+    os.makedirs(download_dir, exist_ok=True)
+    logger.info(f"Download directory set to: {download_dir}")
+
+    # Reuse the scraper for callers that loop over many locations by
+    # entering SoilHealthScraper themselves; this helper does one fetch
+    with SoilHealthScraper(download_dir) as scraper:
+        return scraper.fetch(state, district)
+
+# Shared HTTP session so repeat lookups reuse the TCP/TLS connection
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
 
 def get_location_by_ip():
     """Get latitude and longitude from IP address."""
     try:
-        response = requests.get("https://ipinfo.io")
+        response = _http_session.get("https://ipinfo.io", timeout=3)
         data = response.json()
         location = data.get("loc", "Unknown")
         latitude, longitude = location.split(",") if location != "Unknown" else (None, None)
@@ -429,12 +611,20 @@ def get_location_by_ip():
         logger.error(f"Error getting location by IP: {str(e)}")
         return None, None
 
+# Shared geolocator; Nominatim allows only ~1 request/second so reverse
+# lookups are cached on ~100m coordinate buckets
+_geolocator = Nominatim(user_agent="IIA")
+
+@lru_cache(maxsize=1024)
+def _reverse_geocode(lat_rounded, lon_rounded):
+    """Reverse geocode a rounded coordinate pair, memoized across calls."""
+    return _geolocator.reverse(f"{lat_rounded},{lon_rounded}")
+
 def get_location_details(lat, lon):
     """Get state and district from latitude and longitude."""
     try:
-        geolocator = Nominatim(user_agent="IIA")
-        location = geolocator.reverse(f"{lat},{lon}")
-        
+        location = _reverse_geocode(round(float(lat), 3), round(float(lon), 3))
+
         # Convert state to uppercase and format district appropriately
         state = location.raw['address'].get('state', '').upper()
         district = location.raw['address'].get('state_district', '')
@@ -468,22 +658,10 @@ if __name__ == "__main__":
             state, district = "ANDHRA PRADESH", "ANANTAPUR"
             logger.warning("Using default location values")
         
-        # Create a temporary download directory
-        download_dir = os.path.join(os.getcwd(), "temp_downloads")
-        success = download_soil_health_data(state=state, district=district, download_dir=download_dir)
-        
-        # Clean up temporary download directory
-        if os.path.exists(download_dir):
-            try:
-                for file in os.listdir(download_dir):
-                    file_path = os.path.join(download_dir, file)
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
-                os.rmdir(download_dir)
-                logger.info("Cleaned up temporary download directory")
-            except Exception as e:
-                logger.warning(f"Error cleaning up download directory: {str(e)}")
-        
+        # Scrape into a temporary download directory that cleans itself up
+        with tempfile.TemporaryDirectory(prefix="soilhealth_") as download_dir:
+            success = download_soil_health_data(state=state, district=district, download_dir=download_dir)
+
         sys.exit(0 if success else 1)
     except Exception as e:
         logger.error(f"Script failed: {str(e)}")
@@ -1,41 +1,99 @@
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import openmeteo_requests
 import requests_cache
+import numpy as np
 import pandas as pd
 from retry_requests import retry
-from geopy.geocoders import Nominatim
+from diskcache import Cache
+import reverse_geocoder
 from datetime import datetime, timedelta
 import sqlite3
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
 
+# Shared HTTP session with keepalive so repeat calls skip the TLS handshake
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+
+# Disk cache for geolocation results; the machine's location barely
+# changes, so warm runs skip the ipinfo RTT
+_geo_cache = Cache('.cache/geo')
+
+@_geo_cache.memoize(expire=3600)
 def get_location_by_ip():
-    response = requests.get("https://ipinfo.io")
+    response = _session.get("https://ipinfo.io", timeout=3)
     data = response.json()
     location = data.get("loc", "Unknown")
     latitude, longitude = location.split(",") if location != "Unknown" else (None, None)
     return latitude, longitude
 
 def get_location_details(lat, lon):
-    geolocator = Nominatim(user_agent="IIA")
-    location = geolocator.reverse(f"{lat},{lon}")
-    state = location.raw['address'].get('state')
-    district = location.raw['address'].get('state_district')
-    return location.address, state, district
+    # Offline k-d tree lookup over the GeoNames cities1000 data; no
+    # network round trip, unlike the Nominatim call this replaces
+    result = reverse_geocoder.search((float(lat), float(lon)))[0]
+    address = f"{result['name']}, {result['admin1']}"
+    return address, result['admin1'], result['admin2']
+
+# Variable lists mirror the table schemas, so the API payload contains
+# exactly what gets persisted and the FlatBuffer parse does no extra work
+CURRENT_SCHEMA_COLS = (
+    "temperature_2m", "relative_humidity_2m", "apparent_temperature",
+    "precipitation", "rain", "showers", "snowfall", "weather_code",
+    "cloud_cover", "pressure_msl", "surface_pressure", "wind_speed_10m",
+    "wind_direction_10m", "wind_gusts_10m"
+)
+
+HOURLY_SCHEMA_COLS = (
+    "temperature_2m", "relative_humidity_2m", "dew_point_2m", "apparent_temperature",
+    "precipitation_probability", "precipitation", "rain", "showers", "snowfall",
+    "snow_depth", "weather_code", "cloud_cover", "cloud_cover_low", "cloud_cover_mid",
+    "cloud_cover_high", "visibility", "evapotranspiration", "vapour_pressure_deficit",
+    "pressure_msl", "surface_pressure",
+    "wind_speed_10m", "wind_speed_80m", "wind_speed_120m", "wind_speed_180m",
+    "wind_direction_10m", "wind_direction_80m", "wind_direction_120m", "wind_direction_180m",
+    "wind_gusts_10m", "temperature_80m", "temperature_120m", "temperature_180m",
+    "soil_temperature_0cm", "soil_temperature_6cm", "soil_temperature_18cm",
+    "soil_temperature_54cm", "soil_moisture_0_to_1cm", "soil_moisture_1_to_3cm",
+    "soil_moisture_3_to_9cm", "soil_moisture_9_to_27cm", "soil_moisture_27_to_81cm"
+)
+
+DAILY_SCHEMA_COLS = (
+    "temperature_2m_max", "temperature_2m_min", "apparent_temperature_max",
+    "apparent_temperature_min", "sunrise", "sunset", "uv_index_max",
+    "uv_index_clear_sky_max", "precipitation_sum", "rain_sum", "showers_sum",
+    "snowfall_sum", "precipitation_hours", "precipitation_probability_max",
+    "wind_speed_10m_max", "wind_gusts_10m_max", "wind_direction_10m_dominant",
+    "shortwave_radiation_sum", "et0_fao_evapotranspiration"
+)
+
+HISTORICAL_DAILY_COLS = (
+    "temperature_2m_max", "temperature_2m_min",
+    "apparent_temperature_max", "apparent_temperature_min"
+)
 
 def setup_openmeteo_client():
-    cache_session = requests_cache.CachedSession('.cache', expire_after=3600)
+    # Filesystem backend writes one file per response, so the parallel
+    # fetches never queue behind SQLite's single-writer lock
+    cache_session = requests_cache.CachedSession(
+        '.cache', backend='filesystem', expire_after=3600,
+        allowable_methods=('GET',), match_headers=False
+    )
     retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
     return openmeteo_requests.Client(session=retry_session)
 
 def get_forecast_data(lat, lon, openmeteo):
     url = "https://api.open-meteo.com/v1/forecast"
     params = {
-	"latitude": {lat},
-	"longitude": {lon},
-	"current": ["temperature_2m", "relative_humidity_2m", "apparent_temperature", "precipitation", "rain", "showers", "snowfall", "weather_code", "cloud_cover", "pressure_msl", "surface_pressure", "wind_speed_10m", "wind_direction_10m", "wind_gusts_10m"],
-	"hourly": ["temperature_2m", "relative_humidity_2m", "dew_point_2m", "apparent_temperature", "precipitation_probability", "precipitation", "rain", "showers", "snowfall", "snow_depth", "weather_code", "cloud_cover", "cloud_cover_low", "cloud_cover_mid", "cloud_cover_high", "visibility", "evapotranspiration", "vapour_pressure_deficit", "wind_speed_10m", "wind_speed_80m", "wind_speed_120m", "wind_speed_180m", "wind_direction_10m", "wind_direction_80m", "wind_direction_120m", "wind_direction_180m", "wind_gusts_10m", "temperature_80m", "temperature_120m", "temperature_180m", "soil_temperature_0cm", "soil_temperature_6cm", "soil_temperature_18cm", "soil_temperature_54cm", "soil_moisture_0_to_1cm", "soil_moisture_1_to_3cm", "soil_moisture_3_to_9cm", "soil_moisture_9_to_27cm", "soil_moisture_27_to_81cm"],
-	"daily": ["temperature_2m_max", "temperature_2m_min", "apparent_temperature_max", "apparent_temperature_min", "sunrise", "sunset", "uv_index_max", "uv_index_clear_sky_max", "precipitation_sum", "rain_sum", "showers_sum", "snowfall_sum", "precipitation_hours", "precipitation_probability_max", "wind_speed_10m_max", "wind_gusts_10m_max", "wind_direction_10m_dominant", "shortwave_radiation_sum", "et0_fao_evapotranspiration"],
+	"latitude": lat,
+	"longitude": lon,
+	"current": list(CURRENT_SCHEMA_COLS),
+	"hourly": list(HOURLY_SCHEMA_COLS),
+	"daily": list(DAILY_SCHEMA_COLS),
 	"timezone": "auto"
 }
     return openmeteo.weather_api(url, params=params)[0]
@@ -46,16 +104,39 @@ def get_historical_data(lat, lon, openmeteo, days_back):
     
     url = "https://historical-forecast-api.open-meteo.com/v1/forecast"
     params = {
-	"latitude": {lat},
-	"longitude": {lon},
+	"latitude": lat,
+	"longitude": lon,
 	"start_date": start_date,
 	"end_date": end_date,
-	"hourly": ["temperature_2m", "relative_humidity_2m", "dew_point_2m", "apparent_temperature", "precipitation_probability", "precipitation", "rain", "showers", "pressure_msl", "surface_pressure", "cloud_cover", "cloud_cover_low", "cloud_cover_mid", "cloud_cover_high", "visibility", "evapotranspiration", "wind_speed_10m", "wind_speed_80m", "wind_speed_120m", "wind_speed_180m", "wind_direction_10m", "wind_direction_80m", "wind_direction_120m", "wind_direction_180m", "wind_gusts_10m", "temperature_80m", "temperature_120m", "temperature_180m", "soil_temperature_0cm", "soil_temperature_6cm", "soil_temperature_18cm", "soil_temperature_54cm", "soil_moisture_0_to_1cm", "soil_moisture_1_to_3cm", "soil_moisture_3_to_9cm", "soil_moisture_9_to_27cm", "soil_moisture_27_to_81cm"],
-	"daily": ["temperature_2m_max", "temperature_2m_min", "apparent_temperature_max", "apparent_temperature_min"],
+	"hourly": list(HOURLY_SCHEMA_COLS),
+	"daily": list(HISTORICAL_DAILY_COLS),
 	"timezone": "GMT"
 }
     return openmeteo.weather_api(url, params=params)[0]
 
+# Percent-valued fields fit comfortably in float16; halving their bytes
+# shrinks the buffers carried through to the insert boundary
+PERCENT_COLS = (
+    "relative_humidity_2m", "precipitation_probability", "cloud_cover",
+    "cloud_cover_low", "cloud_cover_mid", "cloud_cover_high"
+)
+
+def downcast_percent_columns(data):
+    """Narrow percent-valued columns to float16; others stay float32."""
+    for name in PERCENT_COLS:
+        if name in data:
+            data[name] = data[name].astype(np.float16)
+    return data
+
+def time_axis(block):
+    """Build ISO text timestamps straight from the FlatBuffer time metadata.
+
+    A plain int64 arange viewed as datetime64 is far cheaper than a
+    pandas DatetimeIndex, and the strings bind directly as sqlite TEXT.
+    """
+    ts = np.arange(block.Time(), block.TimeEnd(), block.Interval(), dtype=np.int64)
+    return np.datetime_as_string(ts.view('datetime64[s]'), unit='s')
+
 def process_forecast_data(response):
     # print(f"Coordinates {response.Latitude()}°N {response.Longitude()}°E")
     # print(f"Elevation {response.Elevation()} m asl")
@@ -64,74 +145,31 @@ def process_forecast_data(response):
 
     # Process current data
     current = response.Current()
-    current_vars = [
-        "temperature_2m", "relative_humidity_2m", "apparent_temperature",
-        "precipitation", "rain", "showers", "snowfall", "weather_code",
-        "cloud_cover", "pressure_msl", "surface_pressure", "wind_speed_10m",
-        "wind_direction_10m", "wind_gusts_10m"
-    ]
-    
+
     # print("\nCurrent Weather:")
     # print(f"Current time {current.Time()}")
-    # for i, var in enumerate(current_vars):
+    # for i, var in enumerate(CURRENT_SCHEMA_COLS):
         # print(f"Current {var}: {current.Variables(i).Value()}")
 
     # Process hourly data
     hourly = response.Hourly()
-    hourly_data = {"date": pd.date_range(
-        start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-        end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-        freq=pd.Timedelta(seconds=hourly.Interval()),
-        inclusive="left"
-    )}
-
-    # Add all hourly variables to the dataframe
-    hourly_vars = [
-        "temperature_2m", "relative_humidity_2m", "dew_point_2m", "apparent_temperature",
-        "precipitation_probability", "precipitation", "rain", "showers", "snowfall",
-        "snow_depth", "weather_code", "cloud_cover", "cloud_cover_low", "cloud_cover_mid",
-        "cloud_cover_high", "visibility", "evapotranspiration", "vapour_pressure_deficit",
-        "wind_speed_10m", "wind_speed_80m", "wind_speed_120m", "wind_speed_180m",
-        "wind_direction_10m", "wind_direction_80m", "wind_direction_120m", "wind_direction_180m",
-        "wind_gusts_10m", "temperature_80m", "temperature_120m", "temperature_180m",
-        "soil_temperature_0cm", "soil_temperature_6cm", "soil_temperature_18cm",
-        "soil_temperature_54cm", "soil_moisture_0_to_1cm", "soil_moisture_1_to_3cm",
-        "soil_moisture_3_to_9cm", "soil_moisture_9_to_27cm", "soil_moisture_27_to_81cm"
-    ]
-    
-    for i, var in enumerate(hourly_vars):
-        hourly_data[var] = hourly.Variables(i).ValuesAsNumpy()
+    hourly_data = {"date": time_axis(hourly)}
 
-    hourly_dataframe = pd.DataFrame(data=hourly_data)
-    # print("\nHourly Forecast Data:")
-    # print(hourly_dataframe)
+    # Add all hourly variables, in the same order they were requested
+    for i, var in enumerate(HOURLY_SCHEMA_COLS):
+        hourly_data[var] = hourly.Variables(i).ValuesAsNumpy()
 
     # Process daily data
     daily = response.Daily()
-    daily_data = {"date": pd.date_range(
-        start=pd.to_datetime(daily.Time(), unit="s", utc=True),
-        end=pd.to_datetime(daily.TimeEnd(), unit="s", utc=True),
-        freq=pd.Timedelta(seconds=daily.Interval()),
-        inclusive="left"
-    )}
-
-    daily_vars = [
-    "temperature_2m_max", "temperature_2m_min", "apparent_temperature_max",
-    "apparent_temperature_min", "sunrise", "sunset", "uv_index_max",
-    "uv_index_clear_sky_max", "precipitation_sum", "rain_sum", "showers_sum",
-    "snowfall_sum", "precipitation_hours", "precipitation_probability_max",
-    "wind_speed_10m_max", "wind_gusts_10m_max", "wind_direction_10m_dominant",
-    "shortwave_radiation_sum", "et0_fao_evapotranspiration"
-    ]
+    daily_data = {"date": time_axis(daily)}
 
-    for i, var in enumerate(daily_vars):
+    for i, var in enumerate(DAILY_SCHEMA_COLS):
         daily_data[var] = daily.Variables(i).ValuesAsNumpy()
 
-    daily_dataframe = pd.DataFrame(data=daily_data)
-    # print("\nDaily Forecast Data:")
-    # print(daily_dataframe)
-    
-    return hourly_dataframe, daily_dataframe
+    # Return plain column dicts; the insert path consumes them directly,
+    # so there is no need to materialize DataFrames in between
+    # (ValuesAsNumpy already gives float32, so nothing promotes to float64)
+    return downcast_percent_columns(hourly_data), daily_data
 
 def process_historical_data(response):
     # print(f"Coordinates {response.Latitude()}°N {response.Longitude()}°E")
@@ -141,64 +179,23 @@ def process_historical_data(response):
 
     # Process hourly historical data
     hourly = response.Hourly()
-    hourly_data = {"date": pd.date_range(
-        start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-        end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-        freq=pd.Timedelta(seconds=hourly.Interval()),
-        inclusive="left"
-    )}
-
-    historical_hourly_vars = [
-        "temperature_2m", "relative_humidity_2m", "dew_point_2m", "apparent_temperature",
-        "precipitation_probability", "precipitation", "rain", "showers", "pressure_msl",
-        "surface_pressure", "cloud_cover", "cloud_cover_low", "cloud_cover_mid",
-        "cloud_cover_high", "visibility", "evapotranspiration", "wind_speed_10m",
-        "wind_speed_80m", "wind_speed_120m", "wind_speed_180m", "wind_direction_10m",
-        "wind_direction_80m", "wind_direction_120m", "wind_direction_180m",
-        "wind_gusts_10m", "temperature_80m", "temperature_120m", "temperature_180m",
-        "soil_temperature_0cm", "soil_temperature_6cm", "soil_temperature_18cm",
-        "soil_temperature_54cm", "soil_moisture_0_to_1cm", "soil_moisture_1_to_3cm",
-        "soil_moisture_3_to_9cm", "soil_moisture_9_to_27cm", "soil_moisture_27_to_81cm"
-    ]
-
-    for i, var in enumerate(historical_hourly_vars):
-        hourly_data[var] = hourly.Variables(i).ValuesAsNumpy()
+    hourly_data = {"date": time_axis(hourly)}
 
-    hourly_dataframe = pd.DataFrame(data=hourly_data)
-    # print("\nHistorical Hourly Data:")
-    # print(hourly_dataframe)
+    for i, var in enumerate(HOURLY_SCHEMA_COLS):
+        hourly_data[var] = hourly.Variables(i).ValuesAsNumpy()
 
     # Process daily historical data
     daily = response.Daily()
-    daily_data = {"date": pd.date_range(
-        start=pd.to_datetime(daily.Time(), unit="s", utc=True),
-        end=pd.to_datetime(daily.TimeEnd(), unit="s", utc=True),
-        freq=pd.Timedelta(seconds=daily.Interval()),
-        inclusive="left"
-    )}
-
-    historical_daily_vars = [
-        "temperature_2m_max", "temperature_2m_min",
-        "apparent_temperature_max", "apparent_temperature_min"
-    ]
-
-    for i, var in enumerate(historical_daily_vars):
+    daily_data = {"date": time_axis(daily)}
+
+    for i, var in enumerate(HISTORICAL_DAILY_COLS):
         daily_data[var] = daily.Variables(i).ValuesAsNumpy()
 
-    daily_dataframe = pd.DataFrame(data=daily_data)
-    # print("\nHistorical Daily Data:")
-    # print(daily_dataframe)
-    
-    return hourly_dataframe, daily_dataframe
-def create_database():
-    """Create SQLite database and tables in a database folder"""
-    # Create database directory if it doesn't exist
-    os.makedirs('database', exist_ok=True)
-    
-    # Connect to database in the database folder
-    conn = sqlite3.connect('database/weather_data.db')
+    return downcast_percent_columns(hourly_data), daily_data
+def create_tables(conn):
+    """Create the weather tables (no indexes, so bulk insert stays cheap)"""
     cursor = conn.cursor()
-    
+
     # Create location table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS location (
@@ -320,101 +317,202 @@ def create_database():
         FOREIGN KEY (location_id) REFERENCES location (id)
     )
     ''')
-    
+
     conn.commit()
-    return conn
 
-def store_location_data(conn, address, state, district, lat, lon, elevation, timezone, timezone_abbr, utc_offset):
+def create_indexes(conn):
+    """Create query indexes after ingestion so inserts skip index upkeep"""
     cursor = conn.cursor()
     cursor.execute('''
-    INSERT INTO location (address, state, district, latitude, longitude, elevation, 
+    CREATE INDEX IF NOT EXISTS idx_hourly_weather_loc_time
+    ON hourly_weather(location_id, timestamp)
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_daily_weather_loc_date
+    ON daily_weather(location_id, date)
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_current_weather_loc
+    ON current_weather(location_id)
+    ''')
+    conn.commit()
+
+def create_database():
+    """Create SQLite database and tables in a database folder"""
+    # Create database directory if it doesn't exist
+    os.makedirs('database', exist_ok=True)
+
+    # Connect to database in the database folder. detect_types=0 skips
+    # the Python-level adapter dispatch on every bind (all timestamps are
+    # pre-formatted text) and isolation_level=None leaves transaction
+    # control to the explicit BEGIN/COMMIT around the ingest
+    # cached_statements above the default 128 keeps every insert batch
+    # shape compiled for the life of the connection
+    conn = sqlite3.connect('database/weather_data.db',
+                           detect_types=0, isolation_level=None,
+                           cached_statements=256)
+
+    # Tune for bulk ingest: WAL avoids fsync per commit and the larger
+    # cache/temp settings keep the insert working set in memory
+    conn.executescript('''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    ''')
+
+    create_tables(conn)
+    return conn
+
+# Fixed insert statements live at module level so each execute passes
+# the same string object and hits the connection's statement cache
+_LOCATION_INSERT_SQL = '''
+    INSERT INTO location (address, state, district, latitude, longitude, elevation,
                          timezone, timezone_abbreviation, utc_offset_seconds)
     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (address, state, district, lat, lon, elevation, timezone, timezone_abbr, utc_offset))
-    conn.commit()
-    return cursor.lastrowid
+    '''
 
-def store_current_weather(conn, location_id, current_data):
-    cursor = conn.cursor()
-    cursor.execute('''
+_CURRENT_INSERT_SQL = '''
     INSERT INTO current_weather (
-        location_id, timestamp, temperature_2m, relative_humidity_2m, 
+        location_id, timestamp, temperature_2m, relative_humidity_2m,
         apparent_temperature, precipitation, rain, showers, snowfall,
         weather_code, cloud_cover, pressure_msl, surface_pressure,
         wind_speed_10m, wind_direction_10m, wind_gusts_10m
     )
     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (location_id, datetime.fromtimestamp(current_data.Time()), *[
-        current_data.Variables(i).Value() for i in range(14)
-    ]))
-    conn.commit()
+    '''
+
+def store_location_data(conn, address, state, district, lat, lon, elevation, timezone, timezone_abbr, utc_offset):
+    cursor = conn.cursor()
+    cursor.execute(_LOCATION_INSERT_SQL,
+                   (address, state, district, lat, lon, elevation, timezone, timezone_abbr, utc_offset))
+    return cursor.lastrowid
 
-def store_hourly_data(conn, location_id, hourly_df, is_forecast=True):
-    # Rename 'date' column to 'timestamp' to match database schema
-    hourly_df = hourly_df.rename(columns={'date': 'timestamp'})
-    hourly_df['location_id'] = location_id
-    hourly_df['is_forecast'] = is_forecast
-    hourly_df.to_sql('hourly_weather', conn, if_exists='append', index=False)
+def read_current_values(current):
+    """Read every current-weather value in one pass over the FlatBuffer."""
+    # Bind the accessor locally so the loop avoids repeated attribute lookups
+    variables = current.Variables
+    return [variables(i).Value() for i in range(current.VariablesLength())]
 
-def store_daily_data(conn, location_id, daily_df, is_forecast=True):
-    # Rename 'date' column to match database schema
-    daily_df = daily_df.rename(columns={'date': 'date'})  # In this case the name is the same, but included for consistency
-    daily_df['location_id'] = location_id
-    daily_df['is_forecast'] = is_forecast
-    daily_df.to_sql('daily_weather', conn, if_exists='append', index=False)
+def store_current_weather(conn, location_id, current_data):
+    values = read_current_values(current_data)
+    if len(values) != 14:
+        raise ValueError(f"Expected 14 current weather variables, got {len(values)}")
+    cursor = conn.cursor()
+    cursor.execute(_CURRENT_INSERT_SQL,
+                   (location_id, datetime.fromtimestamp(current_data.Time()).isoformat(sep=' '), *values))
+
+def insert_columns(conn, table, columns):
+    """Batch-insert a dict of column arrays without building a DataFrame"""
+    names = list(columns)
+    values = []
+    for name in names:
+        column = columns[name]
+        # tolist() converts numpy scalars to the Python types sqlite3
+        # binds; timestamps arrive pre-formatted as text, so every bind
+        # is a plain memcpy with no adapter dispatch
+        values.append(column.tolist() if hasattr(column, 'tolist') else list(column))
+
+    col_sql = ', '.join(names)
+    row_placeholder = '(' + ', '.join('?' * len(names)) + ')'
+
+    # Unroll into multi-row VALUES chunks, staying under SQLite's
+    # 999-parameter limit, so one statement inserts ~50 rows at a time
+    rows = list(zip(*values))
+    chunk = max(1, 900 // len(names))
+    cursor = conn.cursor()
+    for start in range(0, len(rows), chunk):
+        batch = rows[start:start + chunk]
+        placeholders = ', '.join([row_placeholder] * len(batch))
+        flat_values = [value for row in batch for value in row]
+        cursor.execute(f"INSERT INTO {table} ({col_sql}) VALUES {placeholders}", flat_values)
+
+def store_hourly_data(conn, location_id, hourly_data, is_forecast=True):
+    # Building a new dict only rebinds the column arrays; nothing is
+    # copied, unlike the old rename + column-assign DataFrame path
+    # The 'date' column maps to the schema's 'timestamp'
+    n_rows = len(hourly_data['date'])
+    columns = {'location_id': [location_id] * n_rows,
+               'timestamp': hourly_data['date'],
+               'is_forecast': [is_forecast] * n_rows}
+    columns.update((name, col) for name, col in hourly_data.items() if name != 'date')
+    insert_columns(conn, 'hourly_weather', columns)
+
+def store_daily_data(conn, location_id, daily_data, is_forecast=True):
+    n_rows = len(daily_data['date'])
+    columns = {'location_id': [location_id] * n_rows,
+               'is_forecast': [is_forecast] * n_rows}
+    columns.update(daily_data)
+    insert_columns(conn, 'daily_weather', columns)
 
 
     
+def fetch_weather_and_location(lat, lon, openmeteo, days_back):
+    """Run the reverse geocode and both Open-Meteo fetches concurrently."""
+    # The three calls only need lat/lon, so total wall time is the max
+    # of the three instead of their sum; the GIL is released during the
+    # socket I/O, and each thread reuses the shared session pool
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        details_future = executor.submit(get_location_details, lat, lon)
+        forecast_future = executor.submit(get_forecast_data, lat, lon, openmeteo)
+        historical_future = executor.submit(get_historical_data, lat, lon, openmeteo, days_back)
+        return details_future.result(), forecast_future.result(), historical_future.result()
+
 def main():
+    import sys
+
     # Get location
     # lat, lon = get_location_by_ip()
     lat=17.6868
     lon=83.2185
-    address, state, district = get_location_details(lat, lon)
-    
+
+    print("\nHow many days of historical data would you like?")
+    sys.stdout.flush()  # Ensure the output is printed before input
+    days_back = int(input())
+
+    # Setup OpenMeteo client
+    openmeteo = setup_openmeteo_client()
+
+    # Fetch location details, forecast and historical data concurrently
+    (address, state, district), forecast_response, historical_response = \
+        fetch_weather_and_location(lat, lon, openmeteo, days_back)
+
     print(f"Location: {address}")
     print(f"State: {state}")
     print(f"District: {district}")
-    
-    # Setup OpenMeteo client
-    openmeteo = setup_openmeteo_client()
-    
+
     # Create database connection
     conn = create_database()
-    
-    # Get and store forecast data
+
     print("\n=== Forecast Data ===")
-    forecast_response = get_forecast_data(lat, lon, openmeteo)
-    
+
+    # One transaction for the whole ingest; a single fsync at the end
+    conn.execute("BEGIN")
+
     # Store location data
     location_id = store_location_data(
-        conn, address, state, district, 
+        conn, address, state, district,
         forecast_response.Latitude(), forecast_response.Longitude(),
-        forecast_response.Elevation(), 
+        forecast_response.Elevation(),
         forecast_response.Timezone(), forecast_response.TimezoneAbbreviation(),
         forecast_response.UtcOffsetSeconds()
     )
-    
+
     # Process and store forecast data
     store_current_weather(conn, location_id, forecast_response.Current())
     forecast_hourly, forecast_daily = process_forecast_data(forecast_response)
     store_hourly_data(conn, location_id, forecast_hourly, is_forecast=True)
     store_daily_data(conn, location_id, forecast_daily, is_forecast=True)
 
-    import sys
-
-    print("\nHow many days of historical data would you like?")
-    sys.stdout.flush()  # Ensure the output is printed before input
-    days_back = int(input())
     print(f"\n=== Historical Data (Past {days_back} days) ===")
-
-
-    historical_response = get_historical_data(lat, lon, openmeteo, days_back)
     historical_hourly, historical_daily = process_historical_data(historical_response)
     store_hourly_data(conn, location_id, historical_hourly, is_forecast=False)
     store_daily_data(conn, location_id, historical_daily, is_forecast=False)
-    
-    # Close database connection
+
+    # Commit the whole ingest at once, then build the query indexes so
+    # the inserts above never pay for index maintenance
+    conn.commit()
+    create_indexes(conn)
     conn.close()
     
     print("[bold cyan]Weather data has been successfully extracted![\bold cyan]")
@@ -1,6 +1,7 @@
 import os
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -58,7 +59,7 @@ def load_extract_data():
             return  # Stop if any script fails
 
 def load_transform_data():
-    """Load and transform all required data sequentially"""
+    """Load and transform all required data in parallel"""
     data_scripts = [
         "cropDataTranformation.py",
         "fertilizer_data.py",
@@ -67,19 +68,25 @@ def load_transform_data():
         "soilData.py",
         "weatherTransformation.py"
     ]
-    
+
     console.print("\n[bold yellow]Initializing data transformation processes...[/]")
-    
-    for script in data_scripts:
-        script_path = os.path.join(project_root, "DataFetchingAndTransformationFromServer", script)
-        console.print(f"\n[cyan]Running {script}...[/]")
-        
-        success = run_script(script_path)
-        if success:
-            console.print(f"[green]Successfully completed {script}[/]")
-        else:
-            console.print(f"[red]Failed to complete {script}[/]")
-            return  # Stop if any script fails
+
+    # Each transform reads its own sources and writes its own WareHouse
+    # database, so they are independent and can run in worker processes;
+    # wall time becomes the slowest transform instead of the sum
+    with ProcessPoolExecutor(max_workers=min(len(data_scripts), os.cpu_count() or 1)) as executor:
+        futures = {}
+        for script in data_scripts:
+            script_path = os.path.join(project_root, "DataFetchingAndTransformationFromServer", script)
+            console.print(f"\n[cyan]Running {script}...[/]")
+            futures[executor.submit(run_script, script_path)] = script
+
+        for future in as_completed(futures):
+            script = futures[future]
+            if future.result():
+                console.print(f"[green]Successfully completed {script}[/]")
+            else:
+                console.print(f"[red]Failed to complete {script}[/]")
 
 def main():
     # Load environment variables
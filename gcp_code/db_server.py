@@ -2,7 +2,7 @@ import sqlite3
 import zmq
 import logging
 from datetime import datetime
-import json
+import msgpack
 
 # Logging setup
 logging.basicConfig(
@@ -28,16 +28,17 @@ def execute_query(sql_query):
         cursor = connection.cursor()
         cursor.execute(sql_query)
         
-        # Fetch results and column names
+        # Fetch results and column names; ship columns once plus plain
+        # row tuples instead of repeating the keys in a dict per row
         data = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description]
-        
+
         connection.close()
         print(f"Query executed successfully: {sql_query}")  # Log the query
-        return {"data": [dict(zip(columns, row)) for row in data], "error": None}
+        return {"columns": columns, "rows": data, "error": None}
     except sqlite3.Error as e:
         print(f"Database error: {e}")  # Log the error
-        return {"data": None, "error": str(e)}
+        return {"columns": None, "rows": None, "error": str(e)}
 
 def start_server():
     """
@@ -50,26 +51,28 @@ def start_server():
 
     while True:
         try:
-            # Wait for a request from the client
-            message = socket.recv_json()
+            # Wait for a request from the client; msgpack framing packs
+            # and unpacks several times faster than JSON on big results
+            message = msgpack.unpackb(socket.recv(), raw=False)
             log_message(f"Received message: {message}")
 
             if "query" not in message:
-                response = {"results": None, "error": "Missing 'query' field in request"}
-                socket.send_json(response)
+                response = {"columns": None, "rows": None, "error": "Missing 'query' field in request"}
+                socket.send(msgpack.packb(response, use_bin_type=True))
                 log_message("Sent response: Missing 'query' field")
                 continue
 
             sql_query = message["query"]
             # Execute the query and prepare the response
             response = execute_query(sql_query)
-            socket.send_json(response)
-            log_message(f"Sent response: {response}")
+            socket.send(msgpack.packb(response, use_bin_type=True))
+            log_message(f"Sent response: {len(response['rows'] or [])} rows")
 
         except Exception as e:
             error_message = f"Server error: {str(e)}"
             log_message(error_message)
-            socket.send_json({"results": None, "error": error_message})
+            socket.send(msgpack.packb({"columns": None, "rows": None, "error": error_message},
+                                      use_bin_type=True))
 
 if __name__ == "__main__":
     log_message("Starting database server...")
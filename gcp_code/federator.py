@@ -1,50 +1,110 @@
-import zmq
-from rich.console import Console
-from rich.table import Table
-
-
-class DatabaseFederator:
-    def __init__(self, server_configs):
-        self.server_configs = server_configs
-        self.console = Console()
-
-    def query_server(self, server, query):
-        """
-        Send a query to the server and retrieve the results.
-        """
-        context = zmq.Context()
-        socket = context.socket(zmq.REQ)
-        address = f"tcp://{server['host']}:{server['port']}"
-        socket.connect(address)
-
-        try:
-            self.console.print(f"[bold cyan]Sending query to {server['db_name']} at {server['host']}...[/bold cyan]")
-            socket.send_json({"query": query})
-
-            # Wait for the response
-            response = socket.recv_json()
-            if response.get("error"):
-                self.console.print(f"[bold red]Error: {response['error']}[/bold red]")
-                return None
-            self.console.print(f"[bold green]Data extracted from {server['db_name']} at {server['host']}.[/bold green]")
-            return response["data"]
-        except Exception as e:
-            self.console.print(f"[bold red]Failed to query {server['db_name']} at {server['host']}: {e}[/bold red]")
-            return None
-        finally:
-            socket.close()
-
-    def display_data(self, data):
-        """
-        Display the extracted data in a table format.
-        """
-        if not data:
-            self.console.print("[bold yellow]No data available to display.[/bold yellow]")
-            return
-        print(data)
-        # table = Table(show_header=True, header_style="bold magenta")
-        # for column in data[0].keys():
-        #     table.add_column(column)
-        # for row in data:
-        #     table.add_row(*map(str, row.values()))
-        # self.console.print(table)
\ No newline at end of file
+import zmq
+import msgpack
+import pandas as pd
+from diskcache import Cache
+from rich.console import Console
+from rich.table import Table
+
+
+class DatabaseFederator:
+    def __init__(self, server_configs, cache_ttl=3600):
+        self.server_configs = server_configs
+        self.console = Console()
+        # One context for the federator's lifetime and one cached REQ
+        # socket per server, so the TCP connect happens once per server
+        # instead of once per query
+        self.context = zmq.Context()
+        self.sockets = {}
+        # Local result cache keyed by (host, port, query); repeated
+        # queries are answered from disk instead of a network round trip
+        self.cache = Cache('.cache/federator')
+        self.cache_ttl = cache_ttl
+
+    def _get_socket(self, server):
+        """Return the cached socket for a server, connecting on first use."""
+        key = (server['host'], server['port'])
+        socket = self.sockets.get(key)
+        if socket is None:
+            socket = self.context.socket(zmq.REQ)
+            socket.setsockopt(zmq.LINGER, 0)
+            socket.setsockopt(zmq.RCVTIMEO, 30000)
+            socket.setsockopt(zmq.SNDTIMEO, 5000)
+            socket.connect(f"tcp://{server['host']}:{server['port']}")
+            self.sockets[key] = socket
+        return socket
+
+    def _reset_socket(self, server):
+        """Drop a server's socket; REQ sockets get stuck after an error."""
+        socket = self.sockets.pop((server['host'], server['port']), None)
+        if socket is not None:
+            socket.close()
+
+    def invalidate(self, server=None, query=None):
+        """Drop cached results; a specific entry, or everything."""
+        if server is not None and query is not None:
+            self.cache.delete((server['host'], server['port'], query))
+        else:
+            self.cache.clear()
+
+    def query_server(self, server, query):
+        """
+        Send a query to the server and retrieve the results.
+        """
+        cache_key = (server['host'], server['port'], query)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.console.print(f"[bold green]Cache hit for {server['db_name']}.[/bold green]")
+            return cached
+
+        socket = self._get_socket(server)
+
+        try:
+            self.console.print(f"[bold cyan]Sending query to {server['db_name']} at {server['host']}...[/bold cyan]")
+            socket.send(msgpack.packb({"query": query}, use_bin_type=True))
+
+            # Wait for the response; the wire carries the column names
+            # once plus row tuples, so decoding skips a dict per row
+            response = msgpack.unpackb(socket.recv(), raw=False)
+            if response.get("error"):
+                self.console.print(f"[bold red]Error: {response['error']}[/bold red]")
+                return None
+            self.console.print(f"[bold green]Data extracted from {server['db_name']} at {server['host']}.[/bold green]")
+            columns = response["columns"]
+            data = [dict(zip(columns, row)) for row in response["rows"]]
+            self.cache.set(cache_key, data, expire=self.cache_ttl)
+            return data
+        except Exception as e:
+            self.console.print(f"[bold red]Failed to query {server['db_name']} at {server['host']}: {e}[/bold red]")
+            # The REQ state machine is now out of sync; reconnect next time
+            self._reset_socket(server)
+            return None
+
+    def close(self):
+        """Close all cached sockets and terminate the context."""
+        for socket in self.sockets.values():
+            socket.close()
+        self.sockets.clear()
+        self.context.term()
+
+    def display_data(self, data, max_rows=50):
+        """
+        Display the extracted data in a table format.
+        """
+        if not data:
+            self.console.print("[bold yellow]No data available to display.[/bold yellow]")
+            return
+
+        # Stringify column-wise through pandas instead of a Python dict
+        # walk per row, and cap the rendered rows so Rich's layout cost
+        # stays bounded on large result sets
+        df = pd.DataFrame(data)
+        shown = df.head(max_rows)
+        table = Table(show_header=True, header_style="bold magenta")
+        for column in shown.columns:
+            table.add_column(column)
+        string_columns = [shown[column].astype(str).to_numpy() for column in shown.columns]
+        for i in range(len(shown)):
+            table.add_row(*(column[i] for column in string_columns))
+        self.console.print(table)
+        if len(df) > max_rows:
+            self.console.print(f"[bold yellow]... {len(df) - max_rows} more rows not shown.[/bold yellow]")
@@ -1,5 +1,7 @@
 import os
 import sys
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -12,15 +14,29 @@ console = Console()
 # Add this near the top of the file, after the imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Loaded script modules by path; re-running a script skips the import
+# machinery entirely
+_MODULE_CACHE = {}
+
+def _load_script(script_path):
+    """Load a script as a module from its path, caching per path."""
+    script_module = _MODULE_CACHE.get(script_path)
+    if script_module is None:
+        # Load straight from the file path rather than __import__ plus
+        # sys.path.append, which grew sys.path on every invocation and
+        # made every later import scan the duplicates
+        name = os.path.splitext(os.path.basename(script_path))[0]
+        spec = importlib.util.spec_from_file_location(name, script_path)
+        script_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(script_module)
+        _MODULE_CACHE[script_path] = script_module
+    return script_module
+
 def run_script(script_name, args=None):
     """Import and run a script by its filename and pass arguments if needed"""
     try:
         script_path = os.path.join(project_root, "ExtractAndLoad", script_name)
-        script_name_without_extension = os.path.splitext(script_name)[0]
-        
-        # Dynamically import the script module
-        sys.path.append(os.path.dirname(script_path))  # Add folder to sys.path
-        script_module = __import__(script_name_without_extension)
+        script_module = _load_script(script_path)
 
         # Check if the script has a 'main' function
         if hasattr(script_module, 'main'):
@@ -29,24 +45,46 @@ def run_script(script_name, args=None):
             else:
                 script_module.main()
         else:
-            console.print(f"[red]{script_name} does not have a main() function.[/]")
+            console.print(f"{script_name} does not have a main() function.", style="red")
             return False
 
         return True
-        
+
     except Exception as e:
-        console.print(f"[red]Error running {script_name}: {str(e)}[/]")
+        console.print(f"Error running {script_name}: {str(e)}", style="red")
         return False
 
-def display_welcome():
-    """Display welcome message"""
+def _run_scripts_parallel(scripts_with_args):
+    """Run (script, args) pairs in worker processes and report each."""
+    with ProcessPoolExecutor(max_workers=min(len(scripts_with_args), os.cpu_count())) as executor:
+        futures = {
+            executor.submit(run_script, script, args): script
+            for script, args in scripts_with_args
+        }
+        # Plain style= strings skip Rich's markup parser on every line
+        for script, _ in scripts_with_args:
+            console.print(f"\nRunning {script}...", style="cyan")
+        for future in as_completed(futures):
+            script = futures[future]
+            if future.result():
+                console.print(f"Successfully completed {script}", style="green")
+            else:
+                console.print(f"Failed to complete {script}", style="red")
+
+def _build_welcome_text():
     welcome_text = Text()
     welcome_text.append("Welcome to the ", style="green")
     welcome_text.append("Agricultural Advisor System", style="bold green")
     welcome_text.append("!\n\n", style="green")
     welcome_text.append("Your intelligent companion for agricultural decisions.", style="yellow")
-    
-    console.print(Panel(welcome_text, border_style="green"))
+    return welcome_text
+
+# Built once at import; the banner never changes between runs
+_WELCOME_PANEL = Panel(_build_welcome_text(), border_style="green")
+
+def display_welcome():
+    """Display welcome message"""
+    console.print(_WELCOME_PANEL)
 
 def load_extract_data():
     """Load data from ExtractAndLoad folder"""
@@ -55,16 +93,11 @@ def load_extract_data():
         ("soilhealtdata.py", None)
     ]
     
-    console.print("\n[bold yellow]Initializing data extraction processes...[/]")
+    console.print("\nInitializing data extraction processes...", style="bold yellow")
 
-    for script, args in extract_scripts:
-        console.print(f"\n[cyan]Running {script}...[/]")
-
-        success = run_script(script, args)
-        if success:
-            console.print(f"[green]Successfully completed {script}[/]")
-        else:
-            console.print(f"[red]Failed to complete {script}[/]")
+    # The extraction scripts are independent downloads, so run them in
+    # separate processes and let their I/O overlap
+    _run_scripts_parallel(extract_scripts)
 
 def load_transform_data():
     """Load and transform all required data"""
@@ -77,16 +110,11 @@ def load_transform_data():
         "weatherTransformation.py"
     ]
     
-    console.print("\n[bold yellow]Initializing data transformation processes...[/]")
-    
-    for script in data_scripts:
-        console.print(f"\n[cyan]Running {script}...[/]")
+    console.print("\nInitializing data transformation processes...", style="bold yellow")
 
-        success = run_script(script)
-        if success:
-            console.print(f"[green]Successfully completed {script}[/]")
-        else:
-            console.print(f"[red]Failed to complete {script}[/]")
+    # Each transformation reads its own source and writes its own
+    # target database, so they parallelize cleanly across processes
+    _run_scripts_parallel([(script, None) for script in data_scripts])
 
 def main():
     # Load environment variables
@@ -104,8 +132,8 @@ def main():
     # Then run the transformation scripts
     load_transform_data()
 
-    console.print("\n[bold green]Data extraction and transformation completed![/]")
-    console.print("[yellow]Press Enter to exit...[/]")
+    console.print("\nData extraction and transformation completed!", style="bold green")
+    console.print("Press Enter to exit...", style="yellow")
     input()
 
 if __name__ == "__main__":
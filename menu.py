@@ -5,9 +5,10 @@ from colorama import Fore, Style, init
 import sys
 from rich.console import Console
 from rich.table import Table
-import pandas as pd
+import copy
 import sqlite3
 import os
+from functools import lru_cache
 
 # Create a console object
 console = Console()
@@ -32,6 +33,14 @@ def transform_crop_price(df):
     # ... existing code ...
     console.print("[bold green]Transformation for Crop Prices complete.[/bold green]")
 
+@lru_cache(maxsize=None)
+def _table_skeleton(columns):
+    """Build the rich Table skeleton once per distinct column tuple."""
+    table = Table(show_header=True, header_style="bold magenta")
+    for column in columns:
+        table.add_column(column)
+    return table
+
 def disp_table(folder_name, db_file):
     db_path = os.path.join(folder_name, db_file)
     console.print(f"[bold magenta]\\nProcessing database: {db_file}[/bold magenta]")
@@ -45,11 +54,16 @@ def disp_table(folder_name, db_file):
         for table_name in table_names:
             console.print(f"[bold cyan]\\nTable: {table_name}[/bold cyan]")
             try:
-                df = pd.read_sql_query(f"SELECT * FROM {table_name} LIMIT 5", conn)
-                table = Table(show_header=True, header_style="bold magenta")
-                for column in df.columns:
-                    table.add_column(column)
-                for row in df.itertuples(index=False):
+                # Fetch the preview rows straight off the cursor; a
+                # five-row peek doesn't need a DataFrame in between
+                cursor.execute(f"SELECT * FROM {table_name} LIMIT 5")
+                columns = tuple(desc[0] for desc in cursor.description)
+                rows = cursor.fetchall()
+                # Deep-copy the cached skeleton before adding rows;
+                # add_row appends into the column objects, so a shallow
+                # copy would leak rows back into the cache
+                table = copy.deepcopy(_table_skeleton(columns))
+                for row in rows:
                     table.add_row(*map(str, row))
                 console.print(table)
             except Exception as e:
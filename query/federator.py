@@ -1,50 +1,126 @@
-import zmq
-from rich.console import Console
-from rich.table import Table
-
-
-class DatabaseFederator:
-    def __init__(self, server_configs):
-        self.server_configs = server_configs
-        self.console = Console()
-
-    def query_server(self, server, query):
-        """
-        Send a query to the server and retrieve the results.
-        """
-        context = zmq.Context()
-        socket = context.socket(zmq.REQ)
-        address = f"tcp://{server['host']}:{server['port']}"
-        socket.connect(address)
-
-        try:
-            self.console.print(f"[bold cyan]Sending query to {server['db_name']} at {server['host']}...[/bold cyan]")
-            socket.send_json({"query": query})
-
-            # Wait for the response
-            response = socket.recv_json()
-            if response.get("error"):
-                self.console.print(f"[bold red]Error: {response['error']}[/bold red]")
-                return None
-            self.console.print(f"[bold green]Data extracted from {server['db_name']} at {server['host']}.[/bold green]")
-            return response["data"]
-        except Exception as e:
-            self.console.print(f"[bold red]Failed to query {server['db_name']} at {server['host']}: {e}[/bold red]")
-            return None
-        finally:
-            socket.close()
-
-    def display_data(self, data):
-        """
-        Display the extracted data in a table format.
-        """
-        if not data:
-            self.console.print("[bold yellow]No data available to display.[/bold yellow]")
-            return
-        print(data)
-        # table = Table(show_header=True, header_style="bold magenta")
-        # for column in data[0].keys():
-        #     table.add_column(column)
-        # for row in data:
-        #     table.add_row(*map(str, row.values()))
-        # self.console.print(table)
\ No newline at end of file
+import zmq
+import msgpack
+from rich.console import Console
+from rich.table import Table
+
+
+class DatabaseFederator:
+    def __init__(self, server_configs):
+        self.server_configs = server_configs
+        self.console = Console()
+        # One context for the federator's lifetime and one persistent
+        # REQ socket per server; the TCP + ZMQ handshake happens once
+        # per server instead of once per query
+        self.context = zmq.Context()
+        self.sockets = {}
+
+    def _get_socket(self, server):
+        """Return the cached socket for a server, connecting on first use."""
+        key = (server['host'], server['port'])
+        socket = self.sockets.get(key)
+        if socket is None:
+            socket = self.context.socket(zmq.REQ)
+            socket.setsockopt(zmq.LINGER, 0)
+            socket.setsockopt(zmq.RCVTIMEO, 30000)
+            socket.setsockopt(zmq.SNDTIMEO, 5000)
+            socket.connect(f"tcp://{server['host']}:{server['port']}")
+            self.sockets[key] = socket
+        return socket
+
+    def _reset_socket(self, server):
+        """Drop a server's socket; REQ sockets get stuck after an error."""
+        socket = self.sockets.pop((server['host'], server['port']), None)
+        if socket is not None:
+            socket.close()
+
+    def query_server(self, server, query, params=None):
+        """
+        Send a query (with optional bound parameters) to the server and
+        return the result as a (columns, rows) pair, or None on error.
+        """
+        socket = self._get_socket(server)
+
+        try:
+            self.console.print(f"[bold cyan]Sending query to {server['db_name']} at {server['host']}...[/bold cyan]")
+            request = {"query": query}
+            if params:
+                # Constants travel separately from the SQL text, so the
+                # server's statement cache hits across parameter values
+                request["params"] = list(params)
+            socket.send(msgpack.packb(request, use_bin_type=True))
+
+            # The reply is a metadata frame (column names or error)
+            # followed by frames of row tuples, so each frame decodes
+            # on its own instead of the whole result as one blob
+            frames = socket.recv_multipart()
+            meta = msgpack.unpackb(frames[0], raw=False)
+            if meta.get("error"):
+                self.console.print(f"[bold red]Error: {meta['error']}[/bold red]")
+                return None
+            self.console.print(f"[bold green]Data extracted from {server['db_name']} at {server['host']}.[/bold green]")
+            # Keep the columnar shape; rows only become dicts (if ever)
+            # at the caller's display boundary
+            rows = []
+            for frame in frames[1:]:
+                rows.extend(msgpack.unpackb(frame, raw=False))
+            return meta["columns"], rows
+        except Exception as e:
+            self.console.print(f"[bold red]Failed to query {server['db_name']} at {server['host']}: {e}[/bold red]")
+            # The REQ state machine is now out of sync; reconnect next time
+            self._reset_socket(server)
+            return None
+
+    def query_server_batch(self, server, queries, params_list=None):
+        """
+        Send several queries to a server in one round trip and return
+        one (columns, rows) pair per query (None where that query
+        failed).
+        """
+        if not queries:
+            return []
+        socket = self._get_socket(server)
+
+        try:
+            self.console.print(f"[bold cyan]Sending {len(queries)} queries to {server['db_name']} at {server['host']}...[/bold cyan]")
+            request = {"queries": list(queries)}
+            if params_list:
+                request["params"] = [list(p) if p else [] for p in params_list]
+            socket.send(msgpack.packb(request, use_bin_type=True))
+
+            response = msgpack.unpackb(socket.recv(), raw=False)
+            results = []
+            for result, error in zip(response["results"], response["errors"]):
+                if error:
+                    self.console.print(f"[bold red]Error: {error}[/bold red]")
+                    results.append(None)
+                else:
+                    results.append((result["columns"], result["rows"]))
+            self.console.print(f"[bold green]Data extracted from {server['db_name']} at {server['host']}.[/bold green]")
+            return results
+        except Exception as e:
+            self.console.print(f"[bold red]Failed to query {server['db_name']} at {server['host']}: {e}[/bold red]")
+            # The REQ state machine is now out of sync; reconnect next time
+            self._reset_socket(server)
+            return [None] * len(queries)
+
+    def close(self):
+        """Close all cached sockets and terminate the context."""
+        for socket in self.sockets.values():
+            socket.close()
+        self.sockets.clear()
+        self.context.term()
+
+    def display_data(self, data):
+        """
+        Display the extracted data in a table format.
+        """
+        if not data:
+            self.console.print("[bold yellow]No data available to display.[/bold yellow]")
+            return
+        print(data)
+        # table = Table(show_header=True, header_style="bold magenta")
+        # for column in data[0].keys():
+        #     table.add_column(column)
+        # for row in data:
+        #     table.add_row(*map(str, row.values()))
+        # self.console.print(table)
@@ -1,102 +1,165 @@
+import re
 import zmq
+import pandas as pd
 import sqlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from sqlparse.sql import IdentifierList, Identifier, Where
 from sqlparse.tokens import Keyword, DML
 from rich.console import Console
 from rich.table import Table
 from federator import DatabaseFederator
 
+@lru_cache(maxsize=1024)
+def _parse_query_cached(query):
+    """
+    Parse a SQL query once per distinct string; sqlparse's token walk is
+    the most expensive part of query handling, so repeated queries come
+    back from the cache. Returns immutable (select, from, where) so
+    callers cannot mutate cached entries.
+    """
+    parsed = sqlparse.parse(query)[0]
+    tokens = parsed.tokens
+
+    select = []
+    from_tables = []
+    where = None
+    current_keyword = None
+
+    for token in tokens:
+        if token.ttype is Keyword.DML and token.value.upper() == "SELECT":
+            current_keyword = "SELECT"
+        elif token.ttype is Keyword and token.value.upper() == "FROM":
+            current_keyword = "FROM"
+        elif isinstance(token, Where):
+            # Checked before the keyword-state branches: the WHERE group
+            # arrives while still in FROM state and would be swallowed
+            where = str(token)
+        elif current_keyword == "SELECT":
+            if isinstance(token, IdentifierList):
+                select.extend([str(t) for t in token.get_identifiers()])
+            elif isinstance(token, Identifier):
+                select.append(str(token))
+        elif current_keyword == "FROM":
+            if isinstance(token, IdentifierList):
+                from_tables.extend([str(t) for t in token.get_identifiers()])
+            elif isinstance(token, Identifier):
+                from_tables.append(str(token))
+
+    return tuple(select), tuple(from_tables), where
+
+@lru_cache(maxsize=256)
+def _translate_where(where_str):
+    """Translate a SQL WHERE clause into a Python boolean expression."""
+    expr = where_str.strip()
+    if expr.upper().startswith("WHERE"):
+        expr = expr[len("WHERE"):].strip()
+    # Order matters: map <> first, then bare = (but not <=, >=, != or
+    # an already doubled ==), then the keyword operators
+    expr = expr.replace("<>", "!=")
+    expr = re.sub(r"(?<![<>!=])=(?!=)", "==", expr)
+    expr = re.sub(r"\bAND\b", "and", expr, flags=re.IGNORECASE)
+    expr = re.sub(r"\bOR\b", "or", expr, flags=re.IGNORECASE)
+    expr = re.sub(r"\bNOT\b", "not", expr, flags=re.IGNORECASE)
+    return expr
+
 class QueryGen:
     def __init__(self, server_configs):
         """
-        Initialize the federator with server configurations.
-        Creates an instance of DatabaseFederator for each server.
+        Initialize with server configurations and one long-lived
+        DatabaseFederator whose per-server sockets persist across
+        queries.
         """
-        self.server_instances = [
-            {"db_name": server["db_name"], "federator": DatabaseFederator([server])}
-            for server in server_configs
-        ]
+        self.server_configs = server_configs
+        self.federator = DatabaseFederator(server_configs)
         self.console = Console()
+        # One worker per server; queries to different servers are
+        # independent I/O, so total latency is the slowest server's RTT
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(server_configs)))
 
     def query_servers(self, table, query):
         """
-        Send a query to all relevant servers for the specified table.
+        Send a query to all relevant servers for the specified table and
+        return the (columns, rows) pieces that came back.
         """
-        data_from_servers = []
-        for server in self.server_instances:
+        # Each server gets its own thread and its own cached socket, so
+        # no ZMQ socket is ever shared between threads
+        futures = {}
+        for server in self.server_configs:
             self.console.print(f"[bold blue]Checking server: {server['db_name']}[/bold blue]")
-            federator = server["federator"]
-            data = federator.query_server(server_configs[0], query)  # Use server_configs[0] as input
-            if data:
-                data_from_servers.extend(data)
-        return data_from_servers
+            futures[self._executor.submit(self.federator.query_server, server, query)] = server
+
+        pieces = []
+        for future in as_completed(futures):
+            piece = future.result()
+            if piece and piece[1]:
+                pieces.append(piece)
+        return pieces
 
     def parse_query(self, query):
         """
         Parse the SQL query to extract components like SELECT, FROM, and WHERE.
         """
-        parsed = sqlparse.parse(query)[0]
-        tokens = parsed.tokens
-
-        # Extract query components
-        query_components = {"select": [], "from": [], "where": None}
-        current_keyword = None
-
-        for token in tokens:
-            if token.ttype is Keyword.DML and token.value.upper() == "SELECT":
-                current_keyword = "SELECT"
-            elif token.ttype is Keyword and token.value.upper() == "FROM":
-                current_keyword = "FROM"
-            elif current_keyword == "SELECT":
-                if isinstance(token, IdentifierList):
-                    query_components["select"].extend([str(t) for t in token.get_identifiers()])
-                elif isinstance(token, Identifier):
-                    query_components["select"].append(str(token))
-            elif current_keyword == "FROM":
-                if isinstance(token, IdentifierList):
-                    query_components["from"].extend([str(t) for t in token.get_identifiers()])
-                elif isinstance(token, Identifier):
-                    query_components["from"].append(str(token))
-            elif isinstance(token, Where):
-                query_components["where"] = str(token)
-
-        return query_components
+        select, from_tables, where = _parse_query_cached(query)
+        return {"select": list(select), "from": list(from_tables), "where": where}
 
     def federate_data(self, query_components):
         """
         Federate data from multiple servers based on the FROM clause.
         """
-        data_from_servers = []
+        # Push the projection and predicate down to the servers, so
+        # SQLite filters remotely and only matching rows cross the wire
+        select_clause = ", ".join(query_components["select"]) or "*"
+        where_clause = query_components["where"]
+
+        pushdown_queries = []
         for table in query_components["from"]:
-            federated_data = self.query_servers(table, f"SELECT * FROM {table}")
-            if federated_data:
-                data_from_servers.extend(federated_data)
-        return data_from_servers
+            pushdown_query = f"SELECT {select_clause} FROM {table}"
+            if where_clause:
+                pushdown_query += f" {where_clause.strip()}"
+            pushdown_queries.append(pushdown_query)
+
+        # All per-table queries travel to each server in one batched
+        # request, so the round trips per query stay at one per server
+        # regardless of how many tables the FROM clause names
+        futures = {}
+        for server in self.server_configs:
+            self.console.print(f"[bold blue]Checking server: {server['db_name']}[/bold blue]")
+            futures[self._executor.submit(
+                self.federator.query_server_batch, server, pushdown_queries)] = server
+
+        pieces = []
+        for future in as_completed(futures):
+            for piece in future.result():
+                if piece and piece[1]:
+                    pieces.append(piece)
+        return pieces
 
-    def perform_query(self, data, query_components):
+    def perform_query(self, pieces, query_components):
         """
         Perform the query operations such as selection, projection, and filtering.
         """
-        if not data:
+        if not pieces:
             self.console.print("[bold yellow]No data available to perform query.[/bold yellow]")
             return []
 
+        # Build the DataFrame straight from column names plus row
+        # tuples; no per-row dict is ever constructed on the way in
+        frames = [pd.DataFrame(rows, columns=list(columns)) for columns, rows in pieces]
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
         # Perform projection (SELECT columns)
-        projected_data = [
-            {col: row[col] for col in query_components["select"] if col in row}
-            for row in data
-        ]
+        select_cols = [col for col in query_components["select"] if col in df.columns]
+        if select_cols:
+            df = df[select_cols]
 
-        # Perform filtering (WHERE conditions)
+        # Perform filtering (WHERE conditions); df.query evaluates the
+        # translated clause vectorized over whole columns
         if query_components["where"]:
-            condition = query_components["where"]
-            filtered_data = [
-                row for row in projected_data if eval(condition.replace("=", "=="), {}, row)
-            ]
-        else:
-            filtered_data = projected_data
+            df = df.query(_translate_where(query_components["where"]))
 
-        return filtered_data
+        # Rows only become dicts again at the display boundary
+        return df.to_dict("records")
 
     def display_data(self, data):
         """
@@ -137,14 +200,38 @@ server_configs = [
 ]
 
 
+def _precache_parse(buffer):
+    """Speculatively parse while the user types.
+
+    By the time the query is submitted, the parse is already sitting in
+    the lru_cache, so execute_query starts with a cache hit. Partial
+    SQL that sqlparse cannot handle yet is simply ignored.
+    """
+    text = buffer.text.strip()
+    if text and text != 'exit':
+        try:
+            _parse_query_cached(text)
+        except Exception:
+            pass
+
+
 if __name__ == "__main__":
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+    from prompt_toolkit.history import FileHistory
+
     federator = QueryGen(server_configs)
     print("Query Generator started. Enter 'exit' to quit.")
 
+    # Persistent history gives arrow-key recall of earlier queries
+    # across sessions instead of re-typing them
+    session = PromptSession(history=FileHistory(".qg_history"),
+                            auto_suggest=AutoSuggestFromHistory())
+    session.default_buffer.on_text_changed += _precache_parse
+
     while True:
-        
-        query = input("Enter your Query: ")
-        if query=='exit':
+        query = session.prompt("Enter your Query: ")
+        if query == 'exit':
             print("Exiting...")
             break
         federator.execute_query(query)
\ No newline at end of file
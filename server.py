@@ -1,8 +1,9 @@
 import sqlite3
+import threading
 import zmq
+import msgpack
 import logging
 from datetime import datetime
-import json
 
 # Logging setup
 logging.basicConfig(
@@ -19,56 +20,151 @@ def log_message(message):
     logging.info(message)
     print(message)  # Print to console for real-time monitoring
 
-def execute_query(sql_query):
+WORKER_THREADS = 4
+
+_LOCAL = threading.local()
+
+def get_connection():
+    """Open one tuned connection per worker thread and reuse it."""
+    conn = getattr(_LOCAL, "conn", None)
+    if conn is None:
+        # One connection per thread for the server's lifetime: no
+        # per-request open cost, and the PRAGMAs (and SQLite's
+        # per-connection statement cache) stay in effect across queries
+        conn = sqlite3.connect(DB_FILE, isolation_level=None,
+                               cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        _LOCAL.conn = conn
+    return conn
+
+# Column names per SQL text; the schema doesn't change while the
+# server runs, so repeated queries skip rebuilding the list
+_COLUMNS_CACHE = {}
+
+# Rows per streamed frame; the server never materializes more than one
+# frame of a result set at a time
+STREAM_CHUNK_ROWS = 5000
+
+def _send_query_stream(socket, sql_query, params=()):
+    """Execute one query and stream the result as chunked frames.
+
+    The reply is a single multipart message: a metadata frame with the
+    column names (or the error), followed by frames of row tuples
+    fetched with fetchmany, so neither side holds the whole result as
+    one serialized blob.
+    """
+    try:
+        cursor = get_connection().cursor()
+        cursor.execute(sql_query, params)
+        columns = _COLUMNS_CACHE.get(sql_query)
+        if columns is None:
+            columns = [desc[0] for desc in cursor.description]
+            _COLUMNS_CACHE[sql_query] = columns
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")  # Log the error
+        socket.send(msgpack.packb({"columns": None, "error": str(e)}, use_bin_type=True))
+        return
+
+    # Look one chunk ahead so the final frame is sent without SNDMORE
+    chunk = cursor.fetchmany(STREAM_CHUNK_ROWS)
+    socket.send(msgpack.packb({"columns": columns, "error": None}, use_bin_type=True),
+                zmq.SNDMORE if chunk else 0)
+    while chunk:
+        next_chunk = cursor.fetchmany(STREAM_CHUNK_ROWS)
+        socket.send(msgpack.packb(chunk, use_bin_type=True),
+                    zmq.SNDMORE if next_chunk else 0)
+        chunk = next_chunk
+    print(f"Query executed successfully: {sql_query}")  # Log the query
+
+def execute_query(sql_query, params=()):
     """Execute a query on the SQLite database and return the results."""
     try:
-        # Connect to the SQLite database
-        connection = sqlite3.connect(DB_FILE)
-        cursor = connection.cursor()
-        cursor.execute(sql_query)
-        
+        cursor = get_connection().cursor()
+        # Bound parameters keep the SQL text identical across calls that
+        # differ only in constants, so SQLite's statement cache hits
+        # instead of re-parsing a new literal-bearing statement
+        cursor.execute(sql_query, params)
+
         # Fetch results and column names
         data = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        
-        connection.close()
+        columns = _COLUMNS_CACHE.get(sql_query)
+        if columns is None:
+            columns = [desc[0] for desc in cursor.description]
+            _COLUMNS_CACHE[sql_query] = columns
+
         print(f"Query executed successfully: {sql_query}")  # Log the query
-        return {"data": [dict(zip(columns, row)) for row in data], "error": None}
+        # Columnar payload: column names once plus row tuples, instead
+        # of repeating every key in a dict per row
+        return {"columns": columns, "rows": data, "error": None}
     except sqlite3.Error as e:
         print(f"Database error: {e}")  # Log the error
-        return {"data": None, "error": str(e)}
+        return {"columns": None, "rows": None, "error": str(e)}
 
-def start_server():
-    """
-    Start a ZeroMQ server that listens for incoming SQL queries.
-    """
-    context = zmq.Context()
-    socket = context.socket(zmq.REP)  # REP: Response socket
-    socket.bind(f"tcp://0.0.0.0:{ZMQ_PORT}")
-    log_message(f"Server started on port {ZMQ_PORT}")
+def handle_request(message):
+    """Build the response for one incoming request dict."""
+    if "queries" in message:
+        # Batched request: run every query on this worker's connection
+        # and answer in a single reply, so a client federating N tables
+        # pays one round trip instead of N
+        results = []
+        errors = []
+        params_list = message.get("params") or [()] * len(message["queries"])
+        for sql_query, params in zip(message["queries"], params_list):
+            result = execute_query(sql_query, params or ())
+            if result["error"]:
+                results.append(None)
+            else:
+                results.append({"columns": result["columns"], "rows": result["rows"]})
+            errors.append(result["error"])
+        log_message(f"Handled batched request of {len(results)} queries")
+        return {"results": results, "errors": errors}
+
+    log_message("Request missing 'query' field")
+    return {"results": None, "error": "Missing 'query' field in request"}
 
+def worker_loop(context):
+    """Serve requests fanned out over the inproc DEALER."""
+    socket = context.socket(zmq.REP)
+    socket.connect("inproc://workers")
     while True:
         try:
-            # Wait for a request from the client
-            message = socket.recv_json()
+            # msgpack is C-implemented and packs result sets in a
+            # fraction of json's CPU and bytes
+            message = msgpack.unpackb(socket.recv(), raw=False)
             log_message(f"Received message: {message}")
-
-            if "query" not in message:
-                response = {"results": None, "error": "Missing 'query' field in request"}
-                socket.send_json(response)
-                log_message("Sent response: Missing 'query' field")
+            if "query" in message and "queries" not in message:
+                # Single queries stream their rows in chunked frames
+                _send_query_stream(socket, message["query"],
+                                   message.get("params") or ())
+                log_message("Sent streamed response")
                 continue
-
-            sql_query = message["query"]
-            # Execute the query and prepare the response
-            response = execute_query(sql_query)
-            socket.send_json(response)
-            log_message(f"Sent response: {response}")
-
+            socket.send(msgpack.packb(handle_request(message), use_bin_type=True))
         except Exception as e:
             error_message = f"Server error: {str(e)}"
             log_message(error_message)
-            socket.send_json({"results": None, "error": error_message})
+            socket.send(msgpack.packb({"results": None, "error": error_message},
+                                      use_bin_type=True))
+
+def start_server():
+    """
+    Start a ZeroMQ server that listens for incoming SQL queries.
+    """
+    # ROUTER on the wire, DEALER fanning out to worker threads: several
+    # clients are served concurrently, and one slow query no longer
+    # blocks the rest, since WAL lets readers run in parallel
+    context = zmq.Context()
+    router = context.socket(zmq.ROUTER)
+    router.bind(f"tcp://0.0.0.0:{ZMQ_PORT}")
+    dealer = context.socket(zmq.DEALER)
+    dealer.bind("inproc://workers")
+
+    for _ in range(WORKER_THREADS):
+        threading.Thread(target=worker_loop, args=(context,), daemon=True).start()
+
+    log_message(f"Server started on port {ZMQ_PORT} with {WORKER_THREADS} workers")
+    zmq.proxy(router, dealer)
 
 if __name__ == "__main__":
     log_message("Starting database server...")